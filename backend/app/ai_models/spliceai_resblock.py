@@ -90,6 +90,30 @@ class SpliceAI(nn.Module):
         return x
 
 
+@torch.no_grad()
+def fuse_batchnorm(model: nn.Module) -> nn.Module:
+    """Fold each ResBlock's Conv -> BN pair into the conv (eval-mode only).
+
+    In eval mode BatchNorm is a per-channel affine map, so the BN that follows
+    the first conv of every block can be baked into that conv's weight/bias,
+    dropping a full pass over the activations. The leading BN of each block
+    sits before a ReLU and stays as is. The fused model no longer matches the
+    checkpoint's state_dict layout; fuse after loading, never before saving.
+    """
+    for block in model.modules():
+        if not isinstance(block, ResBlock):
+            continue
+        conv, bn = block.path[2], block.path[3]
+        if not isinstance(conv, nn.Conv1d) or not isinstance(bn, nn.BatchNorm1d):
+            continue
+        scale = bn.weight / torch.sqrt(bn.running_var + bn.eps)
+        bias = conv.bias if conv.bias is not None else torch.zeros_like(bn.running_mean)
+        conv.weight.mul_(scale.view(-1, 1, 1))
+        conv.bias = nn.Parameter((bias - bn.running_mean) * scale + bn.bias)
+        block.path[3] = nn.Identity()
+    return model
+
+
 def _looks_like_state_dict(d: Any) -> bool:
     if not isinstance(d, dict) or len(d) == 0:
         return False
@@ -143,8 +167,8 @@ def _safe_device(device: Optional[torch.device]) -> torch.device:
     return device
 
 
-def load_model(ckpt_path: str, *, device: Optional[torch.device] = None) -> SpliceAI:
-    """Load checkpoint into the SpliceAI ResBlock model."""
+def load_model(ckpt_path: str, *, device: Optional[torch.device] = None, fuse_bn: bool = True) -> SpliceAI:
+    """Load checkpoint into the SpliceAI ResBlock model (BN folded unless ``fuse_bn=False``)."""
     device = _safe_device(device)
     model = SpliceAI().to(device)
 
@@ -159,4 +183,9 @@ def load_model(ckpt_path: str, *, device: Optional[torch.device] = None) -> Spli
         model.load_state_dict(state2, strict=True)
 
     model.eval()
+    if fuse_bn:
+        fuse_batchnorm(model)
+    if device.type == "cuda":
+        # Inputs have a fixed length per route; let cuDNN benchmark conv algorithms once.
+        torch.backends.cudnn.benchmark = True
     return model
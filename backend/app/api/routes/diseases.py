@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, conditional_json_response
 from app.schemas.disease import DiseaseListResponse, Step2PayloadResponse
 from app.schemas.region import RegionBase
 from app.services.disease_service import (
@@ -14,46 +16,69 @@ from app.services.disease_service import (
 router = APIRouter(prefix="/diseases", tags=["diseases"])
 
 
+# Read-only payloads below carry ETag/Cache-Control and answer If-None-Match
+# with 304, so browsers/CDNs can revalidate instead of re-downloading.
+
+
 @router.get("", response_model=DiseaseListResponse)
 def list_diseases_endpoint(
+    request: Request,
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-) -> DiseaseListResponse:
-    return list_diseases(limit=limit, offset=offset)
+):
+    payload = list_diseases(limit=limit, offset=offset)
+    return conditional_json_response(request, payload.model_dump(mode="json"))
 
 
 @router.get("/{disease_id}", response_model=Step2PayloadResponse)
 def get_disease_step2_payload(
+    request: Request,
     disease_id: str,
     include_sequence: bool = Query(True, description="Step2에서 region.sequence 포함 여부"),
-) -> Step2PayloadResponse:
-    return get_step2_payload(disease_id, include_sequence=include_sequence)
+):
+    payload = get_step2_payload(disease_id, include_sequence=include_sequence)
+    return conditional_json_response(request, payload.model_dump(mode="json"))
 
 
 @router.get("/{disease_id}/regions/{region_type}/{region_number}", response_model=RegionBase, response_model_exclude_none=True)
 def get_region_by_type_number(
+    request: Request,
     disease_id: str,
     region_type: str,
     region_number: int,
     include_sequence: bool = Query(True, description="region.sequence 포함 여부"),
-) -> RegionBase:
-    return get_region_detail(
+):
+    region = get_region_detail(
         disease_id,
         region_type,
         region_number,
         include_sequence=include_sequence,
     )
+    return conditional_json_response(request, region.model_dump(mode="json", exclude_none=True))
 
 
-@router.get("/{disease_id}/window", response_model_exclude_none=True)
+@router.get("/{disease_id}/window", response_class=FastJSONResponse)
 def get_window(
+    request: Request,
     disease_id: str,
     window_size: int = Query(4000, ge=1, le=250000),
 ):
-    # Returns dict for backward-compatibility (supports legacy ref_seq_4000 fields)
-    return get_window_payload(disease_id, window_size=window_size)
+    # Returns dict for backward-compatibility (supports legacy ref_seq_4000 fields).
+    # The payload is plain str/int/bool, so it is rendered directly instead of
+    # going through jsonable_encoder for multi-kilobyte sequence strings.
+    return conditional_json_response(request, get_window_payload(disease_id, window_size=window_size))
 
 
-@router.get("/{disease_id}/window_4000", include_in_schema=False, response_model_exclude_none=True)
 def get_window_4000(disease_id: str):
-    return get_window_payload(disease_id, window_size=4000)
+    return FastJSONResponse(get_window_payload(disease_id, window_size=4000))
+
+
+# Legacy alias of /window (window_size=4000); registered only when enabled.
+if settings.ENABLE_LEGACY_WINDOW_4000_ROUTE:
+    router.add_api_route(
+        "/{disease_id}/window_4000",
+        get_window_4000,
+        methods=["GET"],
+        include_in_schema=False,
+        response_class=FastJSONResponse,
+    )
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import os
-
 from fastapi import APIRouter, Body, HTTPException
 
+from app.core.config import settings
 from app.schemas.splicing import PredictSplicingRequest, SplicingPredictionResponse
 from app.services.splicing_service import predict_splicing_for_state
 
@@ -14,10 +13,6 @@ router = APIRouter(
 )
 
 
-def _debug_errors() -> bool:
-    return str(os.getenv("DEBUG_ERRORS", "")).strip().lower() in {"1", "true", "yes", "y"}
-
-
 @router.post("/{state_id}/splicing", response_model=SplicingPredictionResponse)
 def predict_splicing_for_state_id(
     state_id: str,
@@ -28,7 +23,7 @@ def predict_splicing_for_state_id(
     Returns model probabilities for the *7-region target span* (focus ±3 regions),
     using ±flank context on both sides (SpliceAI-10k style).
     """
-    dbg = _debug_errors()
+    dbg = settings.DEBUG_ERRORS
 
     try:
         return predict_splicing_for_state(state_id, req)
@@ -1,16 +1,78 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+import email.message
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from app.schemas.state import CreateStateRequest, StatePublic
 from app.services.state_service import create_state_for_disease, get_state_public
 
 router = APIRouter(tags=["states"])
 
+# The create route reads the raw body itself, so FastAPI never sees the model.
+# Its schema is published by reference, with nested models pointing at
+# components/schemas; main.py merges OPENAPI_COMPONENTS into the document.
+_CREATE_STATE_SCHEMA = CreateStateRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+OPENAPI_COMPONENTS: Dict[str, Any] = {
+    **_CREATE_STATE_SCHEMA.pop("$defs", {}),
+    "CreateStateRequest": _CREATE_STATE_SCHEMA,
+}
+
+
+def _is_json_content_type(value: str) -> bool:
+    # Same acceptance rule as FastAPI's typed JSON bodies.
+    message = email.message.Message()
+    message["content-type"] = value
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+def _parse_create_state_request(body: bytes, content_type: Optional[str]) -> CreateStateRequest:
+    # Validate straight from the raw JSON bytes (pydantic-core parses and
+    # validates in one pass instead of json.loads + model_validate).
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    if content_type and not _is_json_content_type(content_type):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "model_attributes_type",
+                    "loc": ("body",),
+                    "msg": "Input should be a valid dictionary or object to extract fields from",
+                    "input": body.decode("utf-8", "replace"),
+                }
+            ],
+            body=body,
+        )
+    try:
+        return CreateStateRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body) from e
+
 
-@router.post("/diseases/{disease_id}/states", response_model=StatePublic)
-def create_state(disease_id: str, req: CreateStateRequest) -> StatePublic:
-    return create_state_for_disease(disease_id, req)
+@router.post(
+    "/diseases/{disease_id}/states",
+    response_model=StatePublic,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/CreateStateRequest"}}},
+            "required": True,
+        }
+    },
+)
+async def create_state(disease_id: str, request: Request) -> StatePublic:
+    req = _parse_create_state_request(await request.body(), request.headers.get("content-type"))
+    # State creation is blocking (supabase-py), keep it off the event loop.
+    return await run_in_threadpool(create_state_for_disease, disease_id, req)
 
 
 @router.get("/states/{state_id}", response_model=StatePublic)
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Optional
-
 from fastapi import APIRouter, Query
 
 from app.core.config import get_settings
@@ -9,7 +7,6 @@ from app.schemas.step4 import (
     CreateStep4StructureJobRequest,
     Step4BaselineResponse,
     Step4CapabilitiesPublic,
-    Step4MolstarTargetPublic,
     Step4StateResponse,
     Step4StructureAssetPublic,
     Step4StructureJobCreateResponse,
@@ -19,54 +16,22 @@ from app.services.step4_baseline_service import (
     get_step4_baseline_for_disease,
     get_step4_baseline_for_state,
 )
-from app.services.step4_state_service import get_step4_for_state
+from app.services.step4_state_service import (
+    default_structure_asset,
+    get_step4_for_state,
+    molstar_target,
+    viewer_format,
+)
 from app.services.structure_job_service import create_step4_structure_job, get_step4_structure_job
 
 
 router = APIRouter(tags=["step4"])
 
 
-def _viewer_format(file_format: Optional[str]) -> Optional[str]:
-    fmt = str(file_format or "").strip().lower()
-    if not fmt:
-        return None
-    if fmt in {"cif", "mmcif"}:
-        return "mmcif"
-    if fmt == "bcif":
-        return "bcif"
-    if fmt == "pdb":
-        return "pdb"
-    return fmt
-
-
-def _pick_default_structure(structures: list[Step4StructureAssetPublic]) -> Optional[Step4StructureAssetPublic]:
-    if not structures:
-        return None
-    for asset in structures:
-        if asset.is_default:
-            return asset
-    return structures[0]
-
-
-def _molstar_target(asset: Optional[Step4StructureAssetPublic]) -> Optional[Step4MolstarTargetPublic]:
-    if not asset or not asset.signed_url:
-        return None
-    return Step4MolstarTargetPublic(
-        structure_asset_id=asset.structure_asset_id,
-        provider=asset.provider,
-        source_db=asset.source_db,
-        source_id=asset.source_id,
-        source_chain_id=asset.source_chain_id,
-        title=asset.title,
-        url=asset.signed_url,
-        format=asset.viewer_format or _viewer_format(asset.file_format),
-    )
-
-
 def _normalize_structures(structures: list[Step4StructureAssetPublic]) -> list[Step4StructureAssetPublic]:
     out: list[Step4StructureAssetPublic] = []
     for asset in structures:
-        out.append(asset.model_copy(update={"viewer_format": _viewer_format(asset.file_format)}))
+        out.append(asset.model_copy(update={"viewer_format": viewer_format(asset.file_format)}))
     return out
 
 
@@ -81,7 +46,7 @@ def _prediction_disabled_reason() -> str:
 def _enrich_baseline(resp: Step4BaselineResponse) -> Step4BaselineResponse:
     settings = get_settings()
     structures = _normalize_structures(list(resp.structures or []))
-    default_asset = _pick_default_structure(structures)
+    default_asset = default_structure_asset(structures)
     ready = bool(default_asset and default_asset.signed_url)
     capabilities = Step4CapabilitiesPublic(
         normal_structure_ready=ready,
@@ -99,7 +64,7 @@ def _enrich_baseline(resp: Step4BaselineResponse) -> Step4BaselineResponse:
             "structures": structures,
             "default_structure_asset_id": (default_asset.structure_asset_id if default_asset else resp.default_structure_asset_id),
             "default_structure": default_asset,
-            "molstar_default": _molstar_target(default_asset),
+            "molstar_default": molstar_target(default_asset),
             "capabilities": capabilities,
             "ready_for_frontend": ready,
             "notes": notes,
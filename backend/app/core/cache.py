@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    Route handlers are sync and run on the worker threadpool, so all mutations
+    go through a lock. Hits read the dict without it (a single dict lookup is
+    atomic under the GIL) and only bump LRU order when the lock is free.
+    ``ttl <= 0`` disables the cache (every lookup misses).
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = int(maxsize)
+        self.ttl = float(ttl)
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if self.ttl <= 0:
+            return default
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            with self._lock:
+                # Another thread may have refreshed or evicted it meanwhile.
+                if self._data.get(key) is item:
+                    del self._data[key]
+            return default
+        # Recency is best-effort: a contended hit keeps its old LRU slot.
+        if self._lock.acquire(blocking=False):
+            try:
+                if key in self._data:
+                    self._data.move_to_end(key)
+            finally:
+                self._lock.release()
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cached(cache: TTLCache, key: Callable[..., Hashable]) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Memoize a function in ``cache`` using ``key(*args, **kwargs)``.
+
+    Exceptions (e.g. 404 HTTPException) are never cached.
+    """
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            k = key(*args, **kwargs)
+            hit = cache.get(k, _MISSING)
+            if hit is not _MISSING:
+                return hit
+            value = fn(*args, **kwargs)
+            cache.set(k, value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+# Disease/gene/region rows only change on admin-side re-ingestion, so read
+# payloads built from them are safe to reuse for a few minutes. Ingestion
+# runs as separate scripts and cannot reach these per-worker caches: after a
+# re-ingest, workers serve stale payloads for up to RESPONSE_CACHE_TTL_SECONDS
+# (assembled sequences are rechecked against the region stamp on that same
+# interval). Restart the API to pick changes up immediately.
+disease_cache = TTLCache(maxsize=512, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+region_cache = TTLCache(maxsize=2048, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+# Raw gene/disease rows by id (repos hand out copies, callers may mutate them).
+row_cache = TTLCache(maxsize=1024, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+# /diseases/{id}/window payloads (two window_size-long strings each, so fewer
+# entries than the other read caches).
+window_cache = TTLCache(maxsize=128, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+# Assembled reference gene sequences (2-bit packed, one per gene),
+# revalidated by region stamp rather than dropped on the short read TTL.
+sequence_cache = TTLCache(maxsize=64, ttl=settings.SEQUENCE_CACHE_TTL_SECONDS)
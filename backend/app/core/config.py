@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from functools import lru_cache
 from typing import List, Optional
 
 # Load .env early (best-effort)
@@ -45,6 +44,14 @@ class Settings:
     APP_NAME: str = _env("APP_NAME", "splice-playground") or "splice-playground"
     APP_VERSION: str = _env("APP_VERSION", "0.1.0") or "0.1.0"
     API_PREFIX: str = _env("API_PREFIX", "/api") or "/api"
+    # Legacy GET /diseases/{id}/window_4000 alias (clients use /window).
+    ENABLE_LEGACY_WINDOW_4000_ROUTE: bool = _parse_bool(_env("ENABLE_LEGACY_WINDOW_4000_ROUTE", "false"), default=False)
+    # Echo exception type/message in 5xx responses (never enable in production).
+    DEBUG_ERRORS: bool = _parse_bool(_env("DEBUG_ERRORS", "false"), default=False)
+
+    # Sync route handlers (Supabase/PostgREST + model inference) run on the AnyIO
+    # worker threadpool; its default capacity (40) caps concurrent requests.
+    API_THREADPOOL_SIZE: int = int(_env("API_THREADPOOL_SIZE", "100") or "100")
 
     # CORS
     CORS_ORIGINS: List[str] = None  # type: ignore
@@ -70,6 +77,15 @@ class Settings:
         _env("SPLICEAI_MODEL_VERSION", "spliceai10k_custom_v1") or "spliceai10k_custom_v1"
     )
     SPLICEAI_DEVICE: Optional[str] = _env("SPLICEAI_DEVICE")  # 'cpu'/'cuda'/'mps'
+    # CUDA-only mixed precision for the forward pass: 'float16'/'bfloat16' (unset = float32).
+    SPLICEAI_AUTOCAST_DTYPE: Optional[str] = _env("SPLICEAI_AUTOCAST_DTYPE")
+    # Concurrent forward passes per worker (1 = serialize; suits a single GPU).
+    SPLICEAI_MAX_CONCURRENT_INFERENCES: int = int(_env("SPLICEAI_MAX_CONCURRENT_INFERENCES", "1") or "1")
+    # torch intra-op threads for CPU inference (0 = torch default).
+    SPLICEAI_TORCH_THREADS: int = int(_env("SPLICEAI_TORCH_THREADS", "0") or "0")
+    # Reuse probabilities for identical model inputs (0 disables).
+    SPLICEAI_PREDICTION_CACHE_TTL_SECONDS: float = float(_env("SPLICEAI_PREDICTION_CACHE_TTL_SECONDS", "3600") or "3600")
+    SPLICEAI_PREDICTION_CACHE_SIZE: int = int(_env("SPLICEAI_PREDICTION_CACHE_SIZE", "128") or "128")
 
     # External biology APIs (STEP4 baseline ingestion / validation)
     ENSEMBL_REST_BASE: str = _env("ENSEMBL_REST_BASE", "https://rest.ensembl.org") or "https://rest.ensembl.org"
@@ -98,16 +114,43 @@ class Settings:
 
     # Reliability / performance knobs
     SUPABASE_RETRY_ATTEMPTS: int = int(_env("SUPABASE_RETRY_ATTEMPTS", "3") or "3")
+    SUPABASE_HTTP_TIMEOUT_SECONDS: float = float(_env("SUPABASE_HTTP_TIMEOUT_SECONDS", "30") or "30")
+    # Connection pool of the shared Supabase httpx client (per worker).
+    SUPABASE_HTTP_MAX_CONNECTIONS: int = int(_env("SUPABASE_HTTP_MAX_CONNECTIONS", "50") or "50")
+    SUPABASE_HTTP_MAX_KEEPALIVE: int = int(_env("SUPABASE_HTTP_MAX_KEEPALIVE", "20") or "20")
+    SUPABASE_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(_env("SUPABASE_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30") or "30")
+    # Probe the disease table once per worker at startup (fail fast on bad creds).
+    STARTUP_DB_CHECK: bool = _parse_bool(_env("STARTUP_DB_CHECK", "true"), default=True)
+    DB_PROBE_TIMEOUT_SECONDS: float = float(_env("DB_PROBE_TIMEOUT_SECONDS", "3") or "3")
+    # /healthz reuses the last DB probe result for this long.
+    HEALTHZ_DB_CACHE_SECONDS: float = float(_env("HEALTHZ_DB_CACHE_SECONDS", "10") or "10")
+    # Threads used to overlap independent PostgREST calls within one request.
+    DB_FANOUT_WORKERS: int = int(_env("DB_FANOUT_WORKERS", "8") or "8")
+    # Multiplex PostgREST/storage calls over one HTTP/2 connection (needs h2).
+    SUPABASE_HTTP2: bool = _parse_bool(_env("SUPABASE_HTTP2", "true"), default=True)
     SUPABASE_RETRY_BACKOFF_SECONDS: float = float(_env("SUPABASE_RETRY_BACKOFF_SECONDS", "0.75") or "0.75")
     STEP4_JOB_POLL_SECONDS: int = int(_env("STEP4_JOB_POLL_SECONDS", "15") or "15")
     STEP4_MAX_STATE_JOB_SUMMARY: int = int(_env("STEP4_MAX_STATE_JOB_SUMMARY", "3") or "3")
     STEP4_ARTIFACT_POLICY: str = _env("STEP4_ARTIFACT_POLICY", "minimal") or "minimal"
+    # In-process TTL cache for read-only disease/region payloads (0 disables).
+    RESPONSE_CACHE_TTL_SECONDS: float = float(_env("RESPONSE_CACHE_TTL_SECONDS", "300") or "300")
+    # Assembled gene sequences are kept longer and revalidated against
+    # max(region.updated_at) once RESPONSE_CACHE_TTL_SECONDS has elapsed.
+    SEQUENCE_CACHE_TTL_SECONDS: float = float(_env("SEQUENCE_CACHE_TTL_SECONDS", "86400") or "86400")
+    # user_state rows are immutable once inserted; cache lookups by state_id.
+    STATE_CACHE_TTL_SECONDS: float = float(_env("STATE_CACHE_TTL_SECONDS", "3600") or "3600")
+    # HTTP caching headers on read-only disease/region/window GETs.
+    HTTP_CACHE_MAX_AGE_SECONDS: int = int(_env("HTTP_CACHE_MAX_AGE_SECONDS", "60") or "60")
+    HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = int(_env("HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS", "600") or "600")
 
     def __post_init__(self) -> None:
         origins = _parse_csv(_env("CORS_ORIGINS", ""))
         object.__setattr__(self, "CORS_ORIGINS", origins)
 
 
-@lru_cache(maxsize=1)
+# Settings are immutable after startup: build them once at import time.
+settings: Settings = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
+    return settings
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.core.config import get_settings
+from app.core.config import settings
+
+
+logger = logging.getLogger("app")
+
+_DEFAULT_ORIGINS = ("http://localhost:3000",)
 
 
 def setup_cors(app: FastAPI) -> None:
@@ -12,13 +19,19 @@ def setup_cors(app: FastAPI) -> None:
     Use env var:
       CORS_ORIGINS=http://localhost:3000,https://example.com
     """
-    settings = get_settings()
-    origins = settings.CORS_ORIGINS
+    # Explicit origins only: CORSMiddleware then does a membership test per
+    # request. "*" would make it reflect every Origin (with credentials).
+    origins = tuple(o.rstrip("/") for o in settings.CORS_ORIGINS if o != "*")
+    if "*" in settings.CORS_ORIGINS:
+        logger.warning(
+            "CORS_ORIGINS: '*' is not supported and was ignored; list the allowed origins explicitly (using %s)",
+            ",".join(origins or _DEFAULT_ORIGINS),
+        )
 
     if not origins:
         # If empty, we still allow localhost during development by default.
         # You can override by explicitly setting CORS_ORIGINS.
-        origins = ["http://localhost:3000"]
+        origins = _DEFAULT_ORIGINS
 
     app.add_middleware(
         CORSMiddleware,
@@ -1,36 +1,47 @@
 from __future__ import annotations
 
 import logging
-import os
 from typing import Any, Optional
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
 
 logger = logging.getLogger("app")
 
 
+_CODE_BY_STATUS = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    409: "CONFLICT",
+    422: "VALIDATION_ERROR",
+}
+
+
 def _code_from_status(status_code: int) -> str:
-    if status_code == 400:
-        return "BAD_REQUEST"
-    if status_code == 401:
-        return "UNAUTHORIZED"
-    if status_code == 403:
-        return "FORBIDDEN"
-    if status_code == 404:
-        return "NOT_FOUND"
-    if status_code == 409:
-        return "CONFLICT"
-    if status_code == 422:
-        return "VALIDATION_ERROR"
+    code = _CODE_BY_STATUS.get(status_code)
+    if code is not None:
+        return code
     if status_code >= 500:
         return "INTERNAL_ERROR"
     return "HTTP_ERROR"
 
 
-def _debug_errors() -> bool:
-    return str(os.getenv("DEBUG_ERRORS", "")).strip().lower() in {"1", "true", "yes", "y"}
+# Upstream (PostgREST/httpx) exception strings can embed whole queries and
+# response bodies; only this much of one is echoed back to the client.
+_MAX_EXC_MESSAGE_CHARS = 512
+
+
+def _exc_message(exc: BaseException) -> str:
+    msg = str(exc)
+    if len(msg) > _MAX_EXC_MESSAGE_CHARS:
+        return msg[:_MAX_EXC_MESSAGE_CHARS] + "…"
+    return msg
 
 
 def error_envelope(code: str, message: str, detail: Optional[Any] = None) -> dict:
@@ -38,39 +49,48 @@ def error_envelope(code: str, message: str, detail: Optional[Any] = None) -> dic
 
 
 def register_exception_handlers(app: FastAPI) -> None:
+    # Settings are frozen at import time; read the flag once, not per error.
+    dbg = settings.DEBUG_ERRORS
+
     @app.exception_handler(HTTPException)
-    async def http_exception_handler(_: Request, exc: HTTPException) -> JSONResponse:
+    async def http_exception_handler(_: Request, exc: HTTPException) -> FastJSONResponse:
         code = _code_from_status(exc.status_code)
         message = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
         detail = None if isinstance(exc.detail, str) else exc.detail
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=exc.status_code,
             content=error_envelope(code, message, detail),
         )
 
     @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(_: Request, exc: RequestValidationError) -> JSONResponse:
-        return JSONResponse(
+    async def validation_exception_handler(_: Request, exc: RequestValidationError) -> FastJSONResponse:
+        return FastJSONResponse(
             status_code=422,
-            content=error_envelope("VALIDATION_ERROR", "Request validation error", detail=exc.errors()),
+            content=error_envelope("VALIDATION_ERROR", "Request validation error", detail=jsonable_encoder(exc.errors())),
         )
 
     @app.exception_handler(ValueError)
-    async def value_error_handler(_: Request, exc: ValueError) -> JSONResponse:
-        return JSONResponse(
+    async def value_error_handler(_: Request, exc: ValueError) -> FastJSONResponse:
+        return FastJSONResponse(
             status_code=400,
-            content=error_envelope("BAD_REQUEST", str(exc), None),
+            content=error_envelope("BAD_REQUEST", _exc_message(exc), None),
         )
 
     @app.exception_handler(Exception)
-    async def unhandled_exception_handler(_: Request, exc: Exception) -> JSONResponse:
-        logger.exception("Unhandled exception", exc_info=exc)
-        if _debug_errors():
-            return JSONResponse(
+    async def unhandled_exception_handler(request: Request, exc: Exception) -> FastJSONResponse:
+        request_id = getattr(request.state, "request_id", None)
+        logger.exception("Unhandled exception id=%s", request_id)
+        # This response is sent by ServerErrorMiddleware, outside
+        # TimingMiddleware, so the request id header must be set here.
+        headers = {"X-Request-ID": request_id} if request_id else None
+        if dbg:
+            return FastJSONResponse(
                 status_code=500,
-                content=error_envelope("INTERNAL_ERROR", f"{type(exc).__name__}: {exc}", None),
+                content=error_envelope("INTERNAL_ERROR", f"{type(exc).__name__}: {_exc_message(exc)}", None),
+                headers=headers,
             )
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content=error_envelope("INTERNAL_ERROR", "Internal Server Error", None),
+            headers=headers,
         )
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from app.core.config import settings
+
+# Shared pool for overlapping independent PostgREST round-trips inside one
+# request. Calls submitted here must not fan out again (no nesting).
+_executor = ThreadPoolExecutor(max_workers=max(1, settings.DB_FANOUT_WORKERS), thread_name_prefix="db-fanout")
+
+
+def run_concurrently(*fns: Callable[[], Any]) -> List[Any]:
+    """Run independent blocking calls in parallel and return their results in order.
+
+    The first call runs on the caller's thread, the rest on the shared pool,
+    so the request waits ~max(RTT) instead of sum(RTT). An exception from any
+    call is re-raised (the earliest one in argument order).
+    """
+    if len(fns) <= 1:
+        return [fn() for fn in fns]
+    futures = [_executor.submit(fn) for fn in fns[1:]]
+    try:
+        first = fns[0]()
+    except BaseException:
+        for f in futures:
+            f.cancel()
+        raise
+    return [first] + [f.result() for f in futures]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger("app.access")
+
+Scope = Dict[str, Any]
+ASGIApp = Callable[..., Any]
+
+
+class TimingMiddleware:
+    """Per-request id, latency and status in one log record.
+
+    Plain ASGI (no BaseHTTPMiddleware) so responses are streamed through
+    untouched. The id is exposed as ``request.state.request_id`` and echoed
+    in the ``X-Request-ID`` response header. Unhandled-exception 500s are
+    sent by ServerErrorMiddleware, outside this one, so the catch-all handler
+    in ``app.core.errors`` sets that header itself.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex[:8]
+        scope.setdefault("state", {})["request_id"] = request_id
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers") or [])
+                headers.append((b"x-request-id", request_id.encode("ascii")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            logger.info(
+                "request id=%s method=%s route=%s status=%s latency_ms=%.1f",
+                request_id,
+                scope.get("method"),
+                getattr(route, "path", None) or scope.get("path"),
+                status,
+                (time.perf_counter() - started) * 1000.0,
+            )
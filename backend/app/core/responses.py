@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+from app.core.config import settings
+
+# orjson is optional: it is much faster than stdlib json on the large sequence
+# payloads (window / step2 / splicing), but the app must run without it.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def render_json(content: Any) -> bytes:
+    """Serialize ``content`` like JSONResponse, using orjson when installed."""
+    if orjson is None:
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available (stdlib json otherwise)."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag == etag or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def conditional_json_response(request: Request, content: Any) -> Response:
+    """JSON response with ETag/Cache-Control that answers ``If-None-Match`` with 304.
+
+    For read-only payloads (disease/region/window) that only change when data
+    is re-ingested; the ETag is a hash of the rendered body.
+    """
+    body = render_json(content)
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, "
+            f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+        ),
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -3,7 +3,12 @@ from __future__ import annotations
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from app.core.config import get_settings
+from app.core.config import settings
+
+try:
+    from postgrest import APIResponse  # type: ignore
+except Exception:  # pragma: no cover - import path differs across versions
+    APIResponse = None  # type: ignore
 
 T = TypeVar("T")
 
@@ -12,8 +17,17 @@ def unwrap_execute_result(res: Any) -> Tuple[Any, Optional[Any], Optional[Any]]:
     """Return (data, count, error) for supabase-py execute() results.
 
     supabase-py v2 returns an object with .data, .count, .error
-    In some contexts you may see a dict-like response.
+    In some contexts you may see a dict-like response. ``maybe_single()``
+    queries return None when no row matched.
+
+    Caveat: postgrest's ``maybe_single().execute()`` replaces *any* APIError
+    (bad input, missing column, 5xx) with a generic "Missing response"
+    (code 204), so the real cause is lost on those lookups. Validate ids
+    before querying where a malformed value is possible.
     """
+    if APIResponse is not None and isinstance(res, APIResponse):
+        # Common case: postgrest's APIResponse (errors are raised, not returned).
+        return res.data, res.count, None
     if hasattr(res, "data"):
         data = res.data
         count = getattr(res, "count", None)
@@ -25,8 +39,7 @@ def unwrap_execute_result(res: Any) -> Tuple[Any, Optional[Any], Optional[Any]]:
 
 
 def first_or_none(data: Any) -> Optional[Dict[str, Any]]:
-    if data is None:
-        return None
+    # PostgREST rows come back as a plain list; check that first.
     if isinstance(data, list):
         return data[0] if data else None
     if isinstance(data, dict):
@@ -35,8 +48,6 @@ def first_or_none(data: Any) -> Optional[Dict[str, Any]]:
 
 
 def as_list(data: Any) -> List[Dict[str, Any]]:
-    if data is None:
-        return []
     if isinstance(data, list):
         return [d for d in data if isinstance(d, dict)]
     if isinstance(data, dict):
@@ -65,7 +76,6 @@ def is_retryable_exception(exc: Exception) -> bool:
 
 
 def run_with_retry(fn: Callable[[], T], *, attempts: Optional[int] = None, backoff_seconds: Optional[float] = None) -> T:
-    settings = get_settings()
     max_attempts = int(attempts or settings.SUPABASE_RETRY_ATTEMPTS or 1)
     base_sleep = float(backoff_seconds or settings.SUPABASE_RETRY_BACKOFF_SECONDS or 0.75)
     last_exc: Optional[Exception] = None
@@ -79,3 +89,41 @@ def run_with_retry(fn: Callable[[], T], *, attempts: Optional[int] = None, backo
             time.sleep(base_sleep * (2**i))
     assert last_exc is not None
     raise last_exc
+
+
+# RPC name -> availability; a name is absent until its first call.
+_rpc_available: Dict[str, bool] = {}
+
+# PostgREST "function not in schema cache" / Postgres undefined_function.
+_RPC_MISSING_CODES = frozenset({"PGRST202", "42883"})
+
+
+def _is_missing_function_error(exc: Exception) -> bool:
+    code = getattr(exc, "code", None)
+    if code is None and isinstance(getattr(exc, "args", None), tuple) and exc.args and isinstance(exc.args[0], dict):
+        code = exc.args[0].get("code")
+    if str(code or "") in _RPC_MISSING_CODES:
+        return True
+    msg = str(exc)
+    return any(c in msg for c in _RPC_MISSING_CODES)
+
+
+def call_optional_rpc(sb: Any, name: str, params: Dict[str, Any]) -> Tuple[bool, Any]:
+    """Call a Postgres function that may not be deployed in every environment.
+
+    Returns (True, data) on success and (False, None) when the caller should
+    use its PostgREST fallback. Only a "function not found" error (PGRST202 /
+    42883) before any success marks the function missing for the life of the
+    process; timeouts, 5xx and bad-input errors just skip that one call.
+    """
+    if _rpc_available.get(name) is False:
+        return False, None
+    try:
+        res = sb.rpc(name, params).execute()
+    except Exception as exc:  # noqa: BLE001
+        if _is_missing_function_error(exc):
+            _rpc_available.setdefault(name, False)
+        return False, None
+    _rpc_available[name] = True
+    data, _, _ = unwrap_execute_result(res)
+    return True, data
@@ -1,10 +1,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
+from app.core.cache import row_cache
+from app.core.fanout import run_concurrently
 from app.db.supabase_client import get_supabase_client
-from app.db.repositories._helpers import as_list, first_or_none, unwrap_execute_result
+from app.db.repositories import gene_repo, snv_repo, window_repo
+from app.db.repositories._helpers import as_list, call_optional_rpc, first_or_none, unwrap_execute_result
 
 
 _LIST_SELECT = (
@@ -13,11 +16,27 @@ _LIST_SELECT = (
 )
 
 
-def list_diseases(limit: int = 100, offset: int = 0, *, include_hidden: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+CountMode = Literal["exact", "planned", "estimated", "none"]
+
+
+def list_diseases(
+    limit: int = 100,
+    offset: int = 0,
+    *,
+    include_hidden: bool = False,
+    count_mode: CountMode = "estimated",
+) -> Tuple[List[Dict[str, Any]], int]:
+    """One page of disease rows plus the total row count.
+
+    ``count_mode`` is passed to PostgREST: "exact" runs a full COUNT(*),
+    "planned" reads the planner estimate, "estimated" counts exactly only for
+    small results and otherwise uses the estimate, "none" skips counting (the
+    page length is returned as the total).
+    """
     sb = get_supabase_client()
     q = (
         sb.table("disease")
-        .select(_LIST_SELECT, count="exact")
+        .select(_LIST_SELECT, count=None if count_mode == "none" else count_mode)
         .range(offset, offset + limit - 1)
         .order("disease_id")
     )
@@ -36,10 +55,152 @@ def list_diseases(limit: int = 100, offset: int = 0, *, include_hidden: bool = F
 
 
 def get_disease(disease_id: str) -> Optional[Dict[str, Any]]:
+    cached = row_cache.get(("disease", disease_id))
+    if cached is not None:
+        return dict(cached)
+
     sb = get_supabase_client()
-    res = sb.table("disease").select("*").eq("disease_id", disease_id).limit(1).execute()
+    res = sb.table("disease").select("*").eq("disease_id", disease_id).maybe_single().execute()
     data, _, _ = unwrap_execute_result(res)
-    return first_or_none(data)
+    row = first_or_none(data)
+    if row:
+        row_cache.set(("disease", disease_id), dict(row))
+    return row
+
+
+
+def get_disease_with_gene(disease_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Return (disease_row, gene_row) in one round-trip via PostgREST embedding.
+
+    Uses the ``disease.gene_id -> gene`` FK. ``gene_row`` is None when the
+    disease has no direct gene_id (bridge-table environments); callers then
+    resolve the gene separately. Falls back to a plain disease lookup if the
+    embed is not available in this schema. Rows are served from ``row_cache``
+    when both are cached.
+    """
+    cached = row_cache.get(("disease", disease_id))
+    if cached is not None:
+        gid = cached.get("gene_id")
+        gene = row_cache.get(("gene", str(gid))) if gid else None
+        if gene is not None or not gid:
+            return dict(cached), (dict(gene) if gene is not None else None)
+
+    sb = get_supabase_client()
+    try:
+        res = sb.table("disease").select(f"*,gene({gene_repo.GENE_SELECT})").eq("disease_id", disease_id).maybe_single().execute()
+    except Exception:
+        return get_disease(disease_id), None
+    data, _, _ = unwrap_execute_result(res)
+    row = first_or_none(data)
+    if not row:
+        return None, None
+    gene = row.pop("gene", None)
+    gene = gene if isinstance(gene, dict) else None
+    row_cache.set(("disease", disease_id), dict(row))
+    if gene and gene.get("gene_id"):
+        row_cache.set(("gene", str(gene["gene_id"])), dict(gene))
+    return row, gene
+
+
+
+_BUNDLE_SELECT = f"*,gene({gene_repo.GENE_SELECT}),splice_altering_snv(*)"
+_BUNDLE_WINDOW_SELECT = ",editing_target_window(start_gene0,end_gene0,label,chosen_by,note,created_at)"
+
+
+def get_disease_bundle(disease_id: str, *, include_window: bool = True) -> Optional[Dict[str, Any]]:
+    """Disease + gene + representative SNV (+ target window) in one request.
+
+    Returns None when the disease does not exist, otherwise a dict with keys
+    ``disease``, ``gene``, ``snv`` and ``window`` (the last three may be None;
+    ``window`` is always None with ``include_window=False``), shaped like the
+    individual repo lookups. Falls back to those lookups when the embedded
+    select is not supported by the schema.
+    """
+    sb = get_supabase_client()
+    select = _BUNDLE_SELECT + (_BUNDLE_WINDOW_SELECT if include_window else "")
+    try:
+        res = (
+            sb.table("disease")
+            .select(select)
+            .eq("disease_id", disease_id)
+            .eq("splice_altering_snv.is_representative", True)
+            .limit(1)
+            .execute()
+        )
+    except Exception:
+        # Everything but the gene is keyed by disease_id: overlap those calls.
+        drow, snv, window = run_concurrently(
+            lambda: get_disease(disease_id),
+            lambda: snv_repo.get_representative_snv(disease_id),
+            lambda: window_repo.get_target_window(disease_id) if include_window else None,
+        )
+        if not drow:
+            return None
+        gid = drow.get("gene_id")
+        return {
+            "disease": drow,
+            "gene": gene_repo.get_gene(str(gid)) if gid else None,
+            "snv": snv,
+            "window": window,
+        }
+
+    data, _, _ = unwrap_execute_result(res)
+    row = first_or_none(data)
+    if not row:
+        return None
+    gene = row.pop("gene", None)
+    snvs = as_list(row.pop("splice_altering_snv", None))
+    windows = as_list(row.pop("editing_target_window", None))
+    snv = snv_repo.normalize_snv_row(snvs[0]) if snvs else snv_repo.legacy_snv_from_disease_id(disease_id)
+    window = min(windows, key=lambda w: str(w.get("created_at") or "")) if windows else None
+    return {
+        "disease": row,
+        "gene": gene if isinstance(gene, dict) else None,
+        "snv": snv,
+        "window": window,
+    }
+
+
+
+def get_disease_detail_full(
+    disease_id: str,
+    *,
+    radius: int = 2,
+    include_sequence: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """STEP2 rows from the ``disease_detail_full`` RPC (sql/20261016_disease_detail_full.sql).
+
+    Returns a dict with ``disease``, ``gene``, ``snv``, ``window``,
+    ``focus_index``, ``start_index`` and ``regions`` (the centered context
+    block, focus included). Returns None whenever the caller should use the
+    regular lookups instead: RPC not deployed, unknown disease, or a disease
+    the RPC cannot fully resolve (no direct gene, no representative SNV row,
+    SNV outside every region).
+    """
+    params = {
+        "p_disease_id": disease_id,
+        "p_radius": int(radius),
+        "p_include_sequence": bool(include_sequence),
+    }
+    ok, data = call_optional_rpc(get_supabase_client(), "disease_detail_full", params)
+    if not ok:
+        return None
+    row = first_or_none(data)
+    if not row:
+        return None
+    if not (row.get("disease") and row.get("gene") and row.get("snv")):
+        return None
+    if row.get("focus_index") is None or row.get("start_index") is None:
+        return None
+    regions = as_list(row.get("regions"))
+    if not 0 <= int(row["focus_index"]) - int(row["start_index"]) < len(regions):
+        return None
+    if not include_sequence:
+        for r in regions:
+            r.pop("sequence", None)
+    row["regions"] = regions
+    row["snv"] = snv_repo.normalize_snv_row(row["snv"])
+    return row
 
 
 
@@ -2,12 +2,35 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+from app.core.cache import row_cache
 from app.db.supabase_client import get_supabase_client
 from app.db.repositories._helpers import first_or_none, unwrap_execute_result
 
 
+# Columns the services read from a gene row (no audit timestamps).
+GENE_SELECT = (
+    "gene_id,gene_symbol,chromosome,strand,length,exon_count,"
+    "canonical_transcript_id,canonical_source,source_version"
+)
+
+
 def get_gene(gene_id: str) -> Optional[Dict[str, Any]]:
+    cached = row_cache.get(("gene", gene_id))
+    if cached is not None:
+        return dict(cached)
+
     sb = get_supabase_client()
-    res = sb.table("gene").select("*").eq("gene_id", gene_id).limit(1).execute()
+
+    def _query(sel: str):
+        return sb.table("gene").select(sel).eq("gene_id", gene_id).maybe_single().execute()
+
+    try:
+        res = _query(GENE_SELECT)
+    except Exception:
+        # older schemas name some of these columns differently
+        res = _query("*")
     data, _, _ = unwrap_execute_result(res)
-    return first_or_none(data)
+    row = first_or_none(data)
+    if row:
+        row_cache.set(("gene", gene_id), dict(row))
+    return row
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.db.supabase_client import get_supabase_client
-from app.db.repositories._helpers import as_list, first_or_none, unwrap_execute_result
+from app.db.repositories._helpers import as_list, call_optional_rpc, first_or_none, unwrap_execute_result
 
 
 _REGION_SELECT_WITH_CDS = (
@@ -13,7 +13,15 @@ _REGION_SELECT_WITH_CDS = (
 _REGION_SELECT_FALLBACK = "region_id,gene_id,region_type,region_number,gene_start_idx,gene_end_idx,length"
 
 
-def _select_region_rows(*, gene_id: str, include_sequence: bool, region_type: Optional[str] = None, region_number: Optional[int] = None) -> List[Dict[str, Any]]:
+def _select_region_rows(
+    *,
+    gene_id: str,
+    include_sequence: bool,
+    region_type: Optional[str] = None,
+    region_number: Optional[int] = None,
+    overlap_start: Optional[int] = None,
+    overlap_end: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     sb = get_supabase_client()
     select = _REGION_SELECT_WITH_CDS + (",sequence" if include_sequence else "")
 
@@ -23,6 +31,11 @@ def _select_region_rows(*, gene_id: str, include_sequence: bool, region_type: Op
             q = q.eq("region_type", region_type)
         if region_number is not None:
             q = q.eq("region_number", int(region_number)).limit(1)
+        # Inclusive gene0 range overlap (served by idx_region_gene_range).
+        if overlap_start is not None:
+            q = q.gte("gene_end_idx", int(overlap_start))
+        if overlap_end is not None:
+            q = q.lte("gene_start_idx", int(overlap_end))
         return q.order("gene_start_idx").execute()
 
     try:
@@ -40,17 +53,128 @@ def _select_region_rows(*, gene_id: str, include_sequence: bool, region_type: Op
 
 
 
-def list_regions_by_gene(gene_id: str, *, include_sequence: bool = True) -> List[Dict[str, Any]]:
+def _rpc_region_rows(name: str, params: Dict[str, Any], *, include_sequence: bool) -> Optional[List[Dict[str, Any]]]:
+    ok, data = call_optional_rpc(get_supabase_client(), name, params)
+    if not ok:
+        return None
+    rows = as_list(data)
+    if not include_sequence:
+        for row in rows:
+            row.pop("sequence", None)
+    return rows
+
+
+
+def list_regions_by_gene(gene_id: str, *, include_sequence: bool = False) -> List[Dict[str, Any]]:
+    """All regions of ``gene_id`` ordered by gene_start_idx.
+
+    Prefers the ``regions_by_gene`` RPC (plan cached by PL/pgSQL, see
+    sql/20261016_hot_lookup_rpcs.sql) and falls back to a table select.
+    """
+    rows = _rpc_region_rows(
+        "regions_by_gene",
+        {"p_gene_id": gene_id, "p_include_sequence": bool(include_sequence)},
+        include_sequence=include_sequence,
+    )
+    if rows is not None:
+        return rows
     return _select_region_rows(gene_id=gene_id, include_sequence=include_sequence)
 
 
 
+def list_regions_overlapping(
+    gene_id: str,
+    start_gene0: int,
+    end_gene0: int,
+    *,
+    include_sequence: bool = False,
+) -> List[Dict[str, Any]]:
+    """Regions of ``gene_id`` overlapping the inclusive gene0 range [start_gene0, end_gene0].
+
+    Prefers the ``regions_overlapping`` RPC (GiST int4range index, see
+    sql/20261016_region_range_gist.sql) and falls back to a plain range filter
+    when the function is not deployed.
+    """
+    rows = _rpc_region_rows(
+        "regions_overlapping",
+        {
+            "p_gene_id": gene_id,
+            "p_start": int(start_gene0),
+            "p_end": int(end_gene0),
+            "p_include_sequence": bool(include_sequence),
+        },
+        include_sequence=include_sequence,
+    )
+    if rows is not None:
+        return rows
+    return _select_region_rows(
+        gene_id=gene_id,
+        include_sequence=include_sequence,
+        overlap_start=start_gene0,
+        overlap_end=end_gene0,
+    )
+
+
+
+def get_window_region_slices(gene_id: str, start_gene0: int, end_gene0: int) -> List[Dict[str, Any]]:
+    """Region rows clipped to the inclusive gene0 window [start_gene0, end_gene0].
+
+    With the ``region_window_sequence`` RPC (sql/20261016_region_window_sequence.sql)
+    each row's gene_start_idx/gene_end_idx/sequence cover only the window part;
+    the fallback returns whole overlapping regions. Either shape works with
+    gene_context.build_sequence_span.
+    """
+    ok, data = call_optional_rpc(
+        get_supabase_client(),
+        "region_window_sequence",
+        {"p_gene_id": gene_id, "p_start": int(start_gene0), "p_end": int(end_gene0)},
+    )
+    if ok:
+        return as_list(data)
+    return list_regions_overlapping(gene_id, start_gene0, end_gene0, include_sequence=True)
+
+
+
+def get_region_sequences(region_ids: List[str]) -> Dict[str, Optional[str]]:
+    """Fetch ``sequence`` for the given region ids in one query -> {region_id: sequence}."""
+    if not region_ids:
+        return {}
+    sb = get_supabase_client()
+    res = sb.table("region").select("region_id,sequence").in_("region_id", list(region_ids)).execute()
+    data, _, _ = unwrap_execute_result(res)
+    return {str(r["region_id"]): r.get("sequence") for r in as_list(data) if r.get("region_id") is not None}
+
+
+
+def get_regions_stamp(gene_id: str) -> Optional[Tuple[Any, Optional[int]]]:
+    """Cheap change marker for a gene's regions: (max(updated_at), row count).
+
+    Returns None if the stamp cannot be read (callers then treat it as unknown).
+    """
+    sb = get_supabase_client()
+    try:
+        res = (
+            sb.table("region")
+            .select("updated_at", count="exact")
+            .eq("gene_id", gene_id)
+            .order("updated_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+    except Exception:
+        return None
+    data, count, _ = unwrap_execute_result(res)
+    row = first_or_none(data)
+    return ((row or {}).get("updated_at"), count)
+
+
+
 def get_region_by_type_number(
     gene_id: str,
     region_type: str,
     region_number: int,
     *,
-    include_sequence: bool = True,
+    include_sequence: bool = False,
 ) -> Optional[Dict[str, Any]]:
     rows = _select_region_rows(
         gene_id=gene_id,
@@ -5,24 +5,62 @@ import re
 from typing import Any, Dict, Optional, Tuple
 
 from app.db.supabase_client import get_supabase_client
-from app.db.repositories._helpers import first_or_none, unwrap_execute_result
+from app.db.repositories._helpers import call_optional_rpc, first_or_none, unwrap_execute_result
 
-_CHR_RE = re.compile(r"(?:^|;)chr=([^;]+)")
-_POS1_RE = re.compile(r"(?:^|;)pos1=([0-9]+)")
+# Ingested notes almost always lead with "chr=<c>;pos1=<n>"; one anchored scan
+# handles that layout, anything else goes through the segment parser.
+_NOTE_RE = re.compile(r"chr=([^;]+);pos1=([0-9]+)(?:;|$)")
+# Leading ASCII digits of a pos1 value (str.isdigit also accepts e.g. "²").
+_POS1_DIGITS_RE = re.compile(r"[0-9]+")
 
 
 def _parse_coordinate_from_note(note: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if not note:
         return None, None
-    m1 = _CHR_RE.search(note)
-    m2 = _POS1_RE.search(note)
-    chrom = m1.group(1) if m1 else None
-    pos1 = int(m2.group(1)) if m2 else None
+    m = _NOTE_RE.match(note)
+    if m:
+        return m.group(1), int(m.group(2))
+    chrom: Optional[str] = None
+    pos1: Optional[int] = None
+    for seg in note.split(";"):
+        k, sep, v = seg.partition("=")
+        if not sep:
+            continue
+        # Same semantics as the original per-key searches: the first non-empty
+        # chr= value and the first pos1= value with a leading digit run.
+        if k == "chr" and chrom is None and v:
+            chrom = v
+        elif k == "pos1" and pos1 is None:
+            d = _POS1_DIGITS_RE.match(v)
+            if d:
+                pos1 = int(d.group())
+        if chrom is not None and pos1 is not None:
+            break
     return chrom, pos1
 
 
+def normalize_snv_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach parsed ``_chrom``/``_pos1`` and default allele_coordinate_system (in place)."""
+    note = row.get("note")
+    chrom = row.get("chromosome") or row.get("chrom") or row.get("chr")
+    pos1 = row.get("pos_hg38_1") or row.get("pos1")
+    if (chrom is None or pos1 is None) and isinstance(note, str):
+        c2, p2 = _parse_coordinate_from_note(note)
+        chrom = chrom or c2
+        pos1 = pos1 or p2
+    row["_chrom"] = chrom
+    row["_pos1"] = int(pos1) if pos1 is not None else None
+    row.setdefault("allele_coordinate_system", "gene_direction")
+    return row
+
+
 def get_representative_snv(disease_id: str) -> Optional[Dict[str, Any]]:
     sb = get_supabase_client()
+    # representative_snv RPC (sql/20261016_hot_lookup_rpcs.sql) when deployed.
+    ok, data = call_optional_rpc(sb, "representative_snv", {"p_disease_id": disease_id})
+    if ok:
+        row = first_or_none(data)
+        return normalize_snv_row(row) if row else legacy_snv_from_disease_id(disease_id)
     try:
         res = (
             sb.table("splice_altering_snv")
@@ -35,20 +73,13 @@ def get_representative_snv(disease_id: str) -> Optional[Dict[str, Any]]:
         data, _, _ = unwrap_execute_result(res)
         row = first_or_none(data)
         if row:
-            note = row.get("note")
-            chrom = row.get("chromosome") or row.get("chrom") or row.get("chr")
-            pos1 = row.get("pos_hg38_1") or row.get("pos1")
-            if (chrom is None or pos1 is None) and isinstance(note, str):
-                c2, p2 = _parse_coordinate_from_note(note)
-                chrom = chrom or c2
-                pos1 = pos1 or p2
-            row["_chrom"] = chrom
-            row["_pos1"] = int(pos1) if pos1 is not None else None
-            row.setdefault("allele_coordinate_system", "gene_direction")
-            return row
+            return normalize_snv_row(row)
     except Exception:
         pass
+    return legacy_snv_from_disease_id(disease_id)
+
 
+def legacy_snv_from_disease_id(disease_id: str) -> Optional[Dict[str, Any]]:
     # fallback parse of legacy disease_id encodes gene-direction allele
     try:
         gene, gene0, pos, change = disease_id.split("_", 3)
@@ -1,20 +1,26 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import uuid
+from typing import Any, Dict, List, Optional
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.db.supabase_client import get_supabase_client
-from app.db.repositories._helpers import first_or_none, unwrap_execute_result
+from app.db.repositories._helpers import as_list, call_optional_rpc, first_or_none, unwrap_execute_result
 
+# user_state rows are insert-only (never updated), so a fetched row can be
+# reused by state_id; lineage walks and STEP3/STEP4 re-read the same states.
+_state_cache = TTLCache(maxsize=4096, ttl=settings.STATE_CACHE_TTL_SECONDS)
 
-def create_state(
+
+def _state_payload(
     disease_id: str,
     *,
     gene_id: Optional[str] = None,
     applied_edit: Optional[dict] = None,
     parent_state_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    sb = get_supabase_client()
     payload: Dict[str, Any] = {"disease_id": disease_id}
     if gene_id is not None:
         payload["gene_id"] = gene_id
@@ -22,26 +28,111 @@ def create_state(
         payload["parent_state_id"] = parent_state_id
     if applied_edit is not None:
         payload["applied_edit"] = applied_edit
+    return payload
+
 
+def _insert_states(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert user_state rows in one request; PostgREST returns them (RETURNING)."""
+    sb = get_supabase_client()
     try:
-        res = sb.table("user_state").insert(payload).execute()
+        res = sb.table("user_state").insert(payloads).execute()
     except Exception as e:
         msg = str(e)
-        if gene_id is not None and ("gene_id" in msg and ("column" in msg or "schema cache" in msg or "record" in msg)):
-            payload.pop("gene_id", None)
-            res = sb.table("user_state").insert(payload).execute()
+        has_gene_id = any("gene_id" in p for p in payloads)
+        if has_gene_id and ("gene_id" in msg and ("column" in msg or "schema cache" in msg or "record" in msg)):
+            payloads = [{k: v for k, v in p.items() if k != "gene_id"} for p in payloads]
+            res = sb.table("user_state").insert(payloads).execute()
         else:
             raise
 
     data, _, _ = unwrap_execute_result(res)
-    row = first_or_none(data)
+    rows = as_list(data)
+    for row in rows:
+        if row.get("state_id"):
+            _state_cache.set(str(row["state_id"]), dict(row))
+    return rows
+
+
+def create_state(
+    disease_id: str,
+    *,
+    gene_id: Optional[str] = None,
+    applied_edit: Optional[dict] = None,
+    parent_state_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    payload = _state_payload(disease_id, gene_id=gene_id, applied_edit=applied_edit, parent_state_id=parent_state_id)
+    row = first_or_none(_insert_states([payload]))
     if not row:
         raise RuntimeError("Failed to create user_state (no row returned)")
     return row
 
 
+def create_states_bulk(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Create several user_state rows in one round-trip.
+
+    Each item takes the ``create_state`` arguments as keys (``disease_id``
+    required; ``gene_id``, ``applied_edit``, ``parent_state_id`` optional).
+    Returns the created rows in input order.
+    """
+    if not rows:
+        return []
+    payloads = [
+        _state_payload(
+            str(r["disease_id"]),
+            gene_id=r.get("gene_id"),
+            applied_edit=r.get("applied_edit"),
+            parent_state_id=r.get("parent_state_id"),
+        )
+        for r in rows
+    ]
+    created = _insert_states(payloads)
+    if len(created) != len(payloads):
+        raise RuntimeError(f"Failed to create user_state rows (expected {len(payloads)}, got {len(created)})")
+    return created
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        return False
+    return True
+
+
 def get_state(state_id: str) -> Optional[Dict[str, Any]]:
+    cached = _state_cache.get(state_id)
+    if cached is not None:
+        return dict(cached)
+    if not _is_uuid(state_id):
+        # state_id is a uuid column: a malformed id cannot match, and querying
+        # it would surface as maybe_single()'s opaque "Missing response".
+        return None
+
     sb = get_supabase_client()
-    res = sb.table("user_state").select("*").eq("state_id", state_id).limit(1).execute()
+    res = sb.table("user_state").select("*").eq("state_id", state_id).maybe_single().execute()
     data, _, _ = unwrap_execute_result(res)
-    return first_or_none(data)
+    row = first_or_none(data)
+    if row:
+        _state_cache.set(state_id, dict(row))
+    return row
+
+
+def prefetch_state_lineage(state_id: Optional[str]) -> None:
+    """Warm the state cache with ``state_id`` and all of its ancestors.
+
+    One ``state_lineage`` RPC replaces the per-ancestor selects of a
+    cold-cache parent-chain walk. A cached ``state_id`` is taken to mean its
+    ancestors were seen too (the walk still fetches any that expired);
+    without the RPC this is a no-op and the walk selects row by row.
+    """
+    if not state_id or _state_cache.get(state_id) is not None:
+        return
+    if not _is_uuid(state_id):
+        # Not a uuid: skip the doomed RPC and let the per-row walk report it.
+        return
+    ok, data = call_optional_rpc(get_supabase_client(), "state_lineage", {"p_state_id": state_id})
+    if not ok:
+        return
+    for row in as_list(data):
+        if row.get("state_id"):
+            _state_cache.set(str(row["state_id"]), dict(row))
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import importlib.util
 import logging
 from functools import lru_cache
-from typing import Any
+from typing import Any, Optional
+
+import httpx
 
 try:
     from supabase import Client, create_client  # type: ignore
@@ -12,11 +15,36 @@ except Exception:  # pragma: no cover - import shape differs across versions
     class Client:  # type: ignore[override]
         pass
 
+try:
+    from supabase import ClientOptions  # type: ignore
+except Exception:  # pragma: no cover
+    ClientOptions = None  # type: ignore
+
 from app.core.config import get_settings
 
 logger = logging.getLogger("app")
 
 
+# The shared httpx client behind get_supabase_client(), kept for shutdown.
+_http_client: Optional[httpx.Client] = None
+
+
+def _build_http_client(timeout: float) -> httpx.Client:
+    """Shared httpx client for PostgREST + storage (HTTP/2 when h2 is installed).
+
+    The pool is bounded so a burst of threadpool requests queues for a
+    connection instead of opening one socket (and TLS handshake) per thread.
+    """
+    settings = get_settings()
+    http2 = bool(settings.SUPABASE_HTTP2) and importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(
+        max_connections=max(1, settings.SUPABASE_HTTP_MAX_CONNECTIONS),
+        max_keepalive_connections=max(0, settings.SUPABASE_HTTP_MAX_KEEPALIVE),
+        keepalive_expiry=settings.SUPABASE_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    return httpx.Client(http2=http2, timeout=timeout, limits=limits, follow_redirects=True)
+
+
 @lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     settings = get_settings()
@@ -26,7 +54,41 @@ def get_supabase_client() -> Client:
         raise RuntimeError(
             "Supabase env vars missing. Set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (recommended) or SUPABASE_ANON_KEY."
         )
-    return create_client(url, key)  # type: ignore[return-value]
+    if ClientOptions is None:
+        return create_client(url, key)  # type: ignore[return-value]
+
+    # One long-lived client per worker: PostgREST/storage share one pooled
+    # (HTTP/2 multiplexed) httpx client, so concurrent threadpool requests
+    # reuse a warm TLS connection. The service key never needs session
+    # refresh/persistence.
+    timeout = float(settings.SUPABASE_HTTP_TIMEOUT_SECONDS)
+    base = dict(auto_refresh_token=False, persist_session=False)
+    global _http_client
+    http_client = _build_http_client(timeout)
+    try:
+        options = ClientOptions(httpx_client=http_client, **base)
+        _http_client = http_client
+    except TypeError:
+        # supabase-py without httpx_client injection: per-service clients
+        http_client.close()
+        options = ClientOptions(
+            postgrest_client_timeout=timeout,
+            storage_client_timeout=int(timeout),
+            **base,
+        )
+    return create_client(url, key, options=options)  # type: ignore[return-value]
+
+
+def close_supabase_client() -> None:
+    """Close pooled connections (worker shutdown / reload); the next call rebuilds the client."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            _http_client.close()
+        except Exception:  # pragma: no cover
+            logger.warning("Failed to close Supabase HTTP client", exc_info=True)
+        _http_client = None
+    get_supabase_client.cache_clear()
 
 
 # Backward-compatible alias (some modules used get_supabase())
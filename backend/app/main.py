@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
+from anyio import to_thread
 from fastapi import FastAPI
 
 from app.api.router import api_router
+from app.api.routes import states
 from app.core.config import get_settings
 from app.core.cors import setup_cors
 from app.core.errors import register_exception_handlers
-from app.db.supabase_client import get_supabase_client
+from app.core.request_logging import TimingMiddleware
+from app.core.responses import FastJSONResponse
+from app.db.supabase_client import close_supabase_client, get_supabase_client
 
 logger = logging.getLogger("app")
 
@@ -21,32 +27,92 @@ def create_app() -> FastAPI:
         format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
     )
 
-    app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
+    app = FastAPI(
+        title=settings.APP_NAME,
+        version=settings.APP_VERSION,
+        default_response_class=FastJSONResponse,
+    )
 
+    app.add_middleware(TimingMiddleware)
     setup_cors(app)
     register_exception_handlers(app)
 
     # API routes
     app.include_router(api_router, prefix=settings.API_PREFIX)
 
+    base_openapi = app.openapi
+
+    def openapi():
+        # Request models parsed by hand in their routes (see states.py) are not
+        # collected by FastAPI; register their schemas so the refs resolve.
+        if app.openapi_schema is None:
+            schema = base_openapi()
+            components = schema.setdefault("components", {}).setdefault("schemas", {})
+            for name, model_schema in states.OPENAPI_COMPONENTS.items():
+                components.setdefault(name, model_schema)
+        return app.openapi_schema
+
+    app.openapi = openapi  # type: ignore[method-assign]
+
     @app.get("/", tags=["system"])
     def root():
         return {"ok": True, "name": settings.APP_NAME, "version": settings.APP_VERSION}
 
+    # Last Supabase probe result, shared by startup and /healthz so liveness
+    # checks do not send a DB round-trip each time.
+    app.state.db_ok = None
+    app.state.db_checked_at = None
+    probe_lock = asyncio.Lock()
+
+    def _probe_db() -> None:
+        get_supabase_client().table("disease").select("disease_id").limit(1).execute()
+
+    async def refresh_db_status() -> bool:
+        async with probe_lock:
+            checked_at = app.state.db_checked_at
+            if checked_at is not None and time.monotonic() - checked_at < settings.HEALTHZ_DB_CACHE_SECONDS:
+                return bool(app.state.db_ok)
+            try:
+                await asyncio.wait_for(asyncio.to_thread(_probe_db), timeout=settings.DB_PROBE_TIMEOUT_SECONDS)
+                ok = True
+            except Exception:
+                logger.warning("Supabase probe failed", exc_info=True)
+                ok = False
+            app.state.db_ok = ok
+            app.state.db_checked_at = time.monotonic()
+            return ok
+
     @app.get("/healthz", tags=["system"])
-    def healthz():
-        return {"ok": True}
+    async def healthz():
+        return {"ok": True, "db": await refresh_db_status()}
+
+    @app.on_event("startup")
+    async def configure_threadpool():
+        # All DB-bound routes are sync (supabase-py is blocking), so the threadpool
+        # size is the effective request concurrency limit per worker.
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = max(1, int(settings.API_THREADPOOL_SIZE))
+        logger.info("AnyIO threadpool size: %s", limiter.total_tokens)
 
     @app.on_event("startup")
-    def startup_check():
-        # Fail fast if Supabase is misconfigured.
-        sb = get_supabase_client()
-        try:
-            sb.table("disease").select("disease_id").limit(1).execute()
-            logger.info("Supabase startup check: OK")
-        except Exception as e:
-            logger.exception("Supabase startup check: FAILED")
-            raise
+    async def startup_check():
+        # Fail fast if Supabase is misconfigured. Building the client already
+        # validates the env vars; the DB round-trip (paid by every worker on
+        # every boot) can be turned off with STARTUP_DB_CHECK=false. The probe
+        # runs off the event loop with a timeout and seeds the /healthz cache.
+        get_supabase_client()
+        if not settings.STARTUP_DB_CHECK:
+            logger.info("Supabase startup check: skipped (STARTUP_DB_CHECK=false)")
+            return
+        if not await refresh_db_status():
+            logger.error("Supabase startup check: FAILED")
+            raise RuntimeError("Supabase startup check failed")
+        logger.info("Supabase startup check: OK")
+
+    @app.on_event("shutdown")
+    def close_connections():
+        # Release pooled Supabase sockets so worker reloads do not leak them.
+        close_supabase_client()
 
     return app
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -33,7 +33,11 @@ class UIHints(BaseModel):
     default_view: str = Field(default="sequence", description="UI default view hint")
 
 
+# Shared immutable default (serializes as a JSON array like a list would).
+_DEFAULT_ALPHABET: Tuple[str, ...] = ("A", "C", "G", "T", "N")
+
+
 class Constraints(BaseModel):
-    sequence_alphabet: List[str] = Field(default_factory=lambda: ["A", "C", "G", "T", "N"])
+    sequence_alphabet: Tuple[str, ...] = Field(default=_DEFAULT_ALPHABET)
     edit_length_must_be_preserved: bool = Field(default=True, description="substitution only")
     edit_type: str = Field(default="substitution_only", description="Editing policy")
@@ -1,11 +1,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 
-from app.db.repositories import disease_repo, gene_repo, region_repo, snv_repo, window_repo
+from app.core.cache import cached, disease_cache, region_cache, window_cache
+from app.db.repositories import disease_repo, region_repo
 from app.schemas.common import Constraints, Highlight, UIHints, Coordinate
 from app.schemas.disease import (
     DiseaseListResponse,
@@ -17,8 +18,14 @@ from app.schemas.disease import (
 )
 from app.schemas.gene import Gene
 from app.schemas.region import RegionBase, RegionContext
-from app.services.gene_context import build_gene_sequence, find_focus_region, pick_regions_with_shift, resolve_single_gene_id_for_disease
-from app.services.storage_service import create_signed_url
+from app.services.gene_context import (
+    get_region_index,
+    pick_regions_with_shift,
+    resolve_gene_row,
+    resolve_single_gene_id_for_disease,
+    sequence_span_buffer,
+)
+from app.services.storage_service import create_signed_url, create_signed_urls
 from app.services.snv_alleles import complement_base
 
 
@@ -36,9 +43,12 @@ def _to_gene_model(row: Dict[str, Any]) -> Gene:
     )
 
 
-def _to_disease_public(row: Dict[str, Any]) -> DiseasePublic:
+def _to_disease_public(
+    row: Dict[str, Any],
+    signed: Optional[Tuple[Optional[str], Optional[int]]] = None,
+) -> DiseasePublic:
     image_path = row.get("image_path")
-    url, exp = create_signed_url(image_path)
+    url, exp = signed if signed is not None else create_signed_url(image_path)
     return DiseasePublic(
         disease_id=str(row.get("disease_id")),
         disease_name=str(row.get("disease_name")),
@@ -54,21 +64,27 @@ def _to_disease_public(row: Dict[str, Any]) -> DiseasePublic:
     )
 
 
+def _region_fields(row: Dict[str, Any], *, include_sequence: bool) -> Dict[str, Any]:
+    return {
+        "region_id": str(row["region_id"]),
+        "region_type": str(row["region_type"]),
+        "region_number": int(row["region_number"]),
+        "gene_start_idx": int(row["gene_start_idx"]),
+        "gene_end_idx": int(row["gene_end_idx"]),
+        "length": int(row["length"]),
+        "sequence": (row.get("sequence") if include_sequence else None),
+    }
+
+
+# Region rows are already constrained by the table's CHECKs (type, number > 0,
+# bounds, length), and the fields are coerced above, so the models are built
+# without re-running validation (sequences can be hundreds of kb).
 def _to_region_base(row: Dict[str, Any], *, include_sequence: bool) -> RegionBase:
-    return RegionBase(
-        region_id=str(row["region_id"]),
-        region_type=str(row["region_type"]),
-        region_number=int(row["region_number"]),
-        gene_start_idx=int(row["gene_start_idx"]),
-        gene_end_idx=int(row["gene_end_idx"]),
-        length=int(row["length"]),
-        sequence=(row.get("sequence") if include_sequence else None),
-    )
+    return RegionBase.model_construct(**_region_fields(row, include_sequence=include_sequence))
 
 
 def _to_region_context(row: Dict[str, Any], *, rel: int, include_sequence: bool) -> RegionContext:
-    b = _to_region_base(row, include_sequence=include_sequence)
-    return RegionContext(**b.model_dump(), rel=rel)
+    return RegionContext.model_construct(**_region_fields(row, include_sequence=include_sequence), rel=int(rel))
 
 
 def _to_snv_model(row: Dict[str, Any]) -> SpliceAlteringSNV:
@@ -93,32 +109,63 @@ def _to_snv_model(row: Dict[str, Any]) -> SpliceAlteringSNV:
 
 def list_diseases(limit: int = 100, offset: int = 0) -> DiseaseListResponse:
     rows, total = disease_repo.list_diseases(limit=limit, offset=offset, include_hidden=False)
-    items = [_to_disease_public(r) for r in rows]
+    # Sign all list images in one storage request instead of one per row.
+    signed = create_signed_urls(r.get("image_path") for r in rows)
+    items = [_to_disease_public(r, signed.get(r.get("image_path") or "", (None, None))) for r in rows]
     return DiseaseListResponse(items=items, count=total)
 
 
-def get_step2_payload(disease_id: str, *, include_sequence: bool = True) -> Step2PayloadResponse:
-    drow = disease_repo.get_disease(disease_id)
-    if not drow:
+def _load_step2_rows(disease_id: str, *, include_sequence: bool):
+    """STEP2 rows via the disease bundle + region queries (no detail RPC)."""
+    # disease + gene + representative SNV + window in a single PostgREST call.
+    bundle = disease_repo.get_disease_bundle(disease_id)
+    if not bundle:
         raise HTTPException(status_code=404, detail=f"disease not found: {disease_id}")
+    drow = bundle["disease"]
 
     gid = resolve_single_gene_id_for_disease(disease_id, drow)
-    grow = gene_repo.get_gene(gid)
+    grow = resolve_gene_row(gid, bundle["gene"])
     if not grow:
         raise HTTPException(status_code=404, detail=f"gene not found: {gid}")
 
-    snv = snv_repo.get_representative_snv(disease_id)
+    snv = bundle["snv"]
     if not snv:
         raise HTTPException(status_code=404, detail=f"representative SNV not found for disease_id={disease_id}")
 
-    regions = region_repo.list_regions_by_gene(gid, include_sequence=include_sequence)
-    if not regions:
+    # Locate focus/context on coordinates only, then pull sequences for just
+    # those (<= 5) regions instead of every region of the gene.
+    index = get_region_index(gid)
+    if not index.rows:
         raise HTTPException(status_code=404, detail=f"no regions for gene_id={gid}")
 
-    focus_idx, focus_row = find_focus_region(regions, int(snv["pos_gene0"]))
-    context_rows, start_idx = pick_regions_with_shift(regions, focus_idx, radius=2)
+    focus_idx, focus_row = index.find_focus(int(snv["pos_gene0"]))
+    context_rows, start_idx = pick_regions_with_shift(index.rows, focus_idx, radius=2)
+    # Indexed rows are shared; copy before attaching sequences.
+    context_rows = [dict(r) for r in context_rows]
+    focus_row = context_rows[focus_idx - start_idx]
+    if include_sequence:
+        seqs = region_repo.get_region_sequences([str(r["region_id"]) for r in context_rows])
+        for r in context_rows:
+            r["sequence"] = seqs.get(str(r["region_id"]))
+    return drow, grow, snv, bundle["window"], focus_idx, focus_row, context_rows, start_idx
+
+
+@cached(disease_cache, key=lambda disease_id, *, include_sequence=True: ("step2", disease_id, include_sequence))
+def get_step2_payload(disease_id: str, *, include_sequence: bool = True) -> Step2PayloadResponse:
+    # One RPC assembles disease/gene/SNV/window and the context block in
+    # Postgres; environments without it go through the bundle + region queries.
+    detail = disease_repo.get_disease_detail_full(disease_id, radius=2, include_sequence=include_sequence)
+    if detail is not None:
+        drow, grow, snv, wrow = detail["disease"], detail["gene"], detail["snv"], detail["window"]
+        context_rows = detail["regions"]
+        start_idx = int(detail["start_index"])
+        focus_idx = int(detail["focus_index"])
+        focus_row = context_rows[focus_idx - start_idx]
+    else:
+        drow, grow, snv, wrow, focus_idx, focus_row, context_rows, start_idx = _load_step2_rows(
+            disease_id, include_sequence=include_sequence
+        )
 
-    wrow = window_repo.get_target_window(disease_id)
     if wrow:
         window = TargetWindow(
             start_gene0=int(wrow.get("start_gene0")),
@@ -160,25 +207,33 @@ def get_step2_payload(disease_id: str, *, include_sequence: bool = True) -> Step
     )
 
 
-_COMP = {"A": "T", "T": "A", "C": "G", "G": "C", "N": "N"}
+_N_ORD = ord("N")
 
 
-def _complement_base(b: str) -> str:
-    return _COMP.get((b or "N").upper(), "N")
+def _normalize_alleles_to_seq(base: str, ref: str, alt: str) -> Tuple[str, str, bool]:
+    """(ref, alt, matched) oriented to ``base``, the uppercase base at the SNV position.
 
-
-def _normalize_alleles_to_seq(base_at_pos: str, ref: str, alt: str) -> Tuple[str, str, bool]:
-    base = (base_at_pos or "N").upper()
+    ``matched`` is True exactly when the returned ref equals ``base``.
+    """
     ref_u = (ref or "N").upper()
     alt_u = (alt or "N").upper()
     if base == ref_u:
         return ref_u, alt_u, True
-    c_ref = _complement_base(ref_u)
+    c_ref = complement_base(ref_u)
     if base == c_ref:
-        return c_ref, _complement_base(alt_u), True
+        return c_ref, complement_base(alt_u), True
     return ref_u, alt_u, False
 
 
+@cached(
+    region_cache,
+    key=lambda disease_id, region_type, region_number, *, include_sequence=True: (
+        disease_id,
+        region_type,
+        int(region_number),
+        include_sequence,
+    ),
+)
 def get_region_detail(
     disease_id: str,
     region_type: str,
@@ -196,19 +251,21 @@ def get_region_detail(
     return _to_region_base(row, include_sequence=include_sequence)
 
 
+@cached(window_cache, key=lambda disease_id, *, window_size=4000: (disease_id, int(window_size)))
 def get_window_payload(disease_id: str, *, window_size: int = 4000) -> Dict[str, Any]:
-    drow = disease_repo.get_disease(disease_id)
-    if not drow:
+    # disease + gene + representative SNV in a single PostgREST call.
+    bundle = disease_repo.get_disease_bundle(disease_id, include_window=False)
+    if not bundle:
         raise HTTPException(status_code=404, detail=f"disease not found: {disease_id}")
+    drow, snv = bundle["disease"], bundle["snv"]
     gid = resolve_single_gene_id_for_disease(disease_id, drow)
-    grow = gene_repo.get_gene(gid)
+    grow = resolve_gene_row(gid, bundle["gene"])
     if not grow:
         raise HTTPException(status_code=404, detail=f"gene not found: {gid}")
     gene_len = int(grow.get("length") or 0)
     if gene_len <= 0:
         raise HTTPException(status_code=400, detail=f"gene.length invalid for gene_id={gid}")
 
-    snv = snv_repo.get_representative_snv(disease_id)
     if not snv:
         raise HTTPException(status_code=404, detail=f"representative SNV not found for disease_id={disease_id}")
 
@@ -216,9 +273,6 @@ def get_window_payload(disease_id: str, *, window_size: int = 4000) -> Dict[str,
     ref = str(snv["ref"])
     alt = str(snv["alt"])
 
-    regions = region_repo.list_regions_by_gene(gid, include_sequence=True)
-    gene_seq = build_gene_sequence(gene_len, regions)
-
     ws = int(window_size)
     if ws <= 0:
         raise HTTPException(status_code=400, detail="window_size must be > 0")
@@ -227,21 +281,22 @@ def get_window_payload(disease_id: str, *, window_size: int = 4000) -> Dict[str,
     start_gene0 = pos_gene0 - center_idx
     end_gene0 = start_gene0 + ws
 
-    pad_left = max(0, -start_gene0)
-    pad_right = max(0, end_gene0 - gene_len)
-
     s = max(0, start_gene0)
     e = min(gene_len, end_gene0)
-    ref_seq = ("N" * pad_left) + gene_seq[s:e] + ("N" * pad_right)
-    if len(ref_seq) != ws:
-        raise HTTPException(status_code=500, detail=f"window extraction length mismatch (got {len(ref_seq)} expected {ws})")
+    # Only the window's slice of each overlapping region is fetched. The
+    # buffer spans the whole window; positions outside the gene stay "N".
+    regions = region_repo.get_window_region_slices(gid, s, e - 1) if e > s else []
+    buf = sequence_span_buffer(start_gene0, end_gene0, regions)
+    if len(buf) != ws:
+        raise HTTPException(status_code=500, detail=f"window extraction length mismatch (got {len(buf)} expected {ws})")
+    ref_seq = buf.decode("ascii")
 
-    base_at = ref_seq[center_idx]
-    ref_n, alt_n, ok = _normalize_alleles_to_seq(base_at, ref, alt)
+    # The buffer is already uppercase: one byte load, no re-normalization.
+    ref_n, alt_n, ok = _normalize_alleles_to_seq(chr(buf[center_idx]), ref, alt)
 
-    alt_list = list(ref_seq)
-    alt_list[center_idx] = alt_n
-    alt_seq = "".join(alt_list)
+    # Single-base substitution in the same buffer once ref_seq is decoded.
+    buf[center_idx] = ord(alt_n[0]) if alt_n else _N_ORD
+    alt_seq = buf.decode("ascii")
 
     out: Dict[str, Any] = {
         "disease_id": disease_id,
@@ -253,7 +308,7 @@ def get_window_payload(disease_id: str, *, window_size: int = 4000) -> Dict[str,
         "pos_gene0": pos_gene0,
         "ref_base": ref_n,
         "alt_base": alt_n,
-        "ref_matches": bool(ok and base_at.upper() == ref_n),
+        "ref_matches": ok,
         "ref_seq": ref_seq,
         "alt_seq": alt_seq,
     }
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import time
+from bisect import bisect_right
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-from app.db.repositories import disease_repo
+import numpy as np
+
+from app.core.cache import region_cache, sequence_cache
+from app.core.config import settings
+from app.db.repositories import disease_repo, gene_repo, region_repo
+from app.utils.packed_dna import PackedSequence
 
 
 def resolve_single_gene_id_for_disease(disease_id: str, disease_row: Dict[str, Any]) -> str:
@@ -24,19 +31,134 @@ def resolve_single_gene_id_for_disease(disease_id: str, disease_row: Dict[str, A
     raise ValueError(f"Multiple gene_ids for disease_id={disease_id}: {gids}")
 
 
+def resolve_gene_row(gene_id: str, embedded: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Return the gene row, reusing an embedded row from the disease query when it matches."""
+    if embedded and str(embedded.get("gene_id") or "") == str(gene_id):
+        return embedded
+    return gene_repo.get_gene(gene_id)
+
+
 def build_gene_sequence(gene_len: int, regions: List[Dict[str, Any]]) -> str:
     """Assemble the full gene-direction sequence from region rows.
 
     Region coordinates are gene0, 0-based, inclusive at both ends.
     Missing / uncovered positions remain as ``N``.
     """
-    seq = ["N"] * int(gene_len)
+    gene_len = int(gene_len)
+    tiled = _contiguous_region_sequences(gene_len, regions)
+    if tiled is not None:
+        return "".join(tiled).upper()
+    return build_sequence_span(0, gene_len, regions)
+
+
+def _contiguous_region_sequences(gene_len: int, regions: List[Dict[str, Any]]) -> Optional[List[str]]:
+    """Region sequences in gene order when they tile [0, gene_len) exactly.
+
+    This is the normal shape of ingested data (exon/intron rows back to
+    back, each sequence as long as its range), where assembly is a plain
+    concatenation. Returns None for gaps, overlaps or length mismatches.
+    Region repos already return rows ordered by gene_start_idx; rows in any
+    other order fail the contiguity check and take the general path.
+    """
+    seqs: List[str] = []
+    expect = 0
+    for r in regions:
+        rseq = r.get("sequence") or ""
+        # PostgREST decodes int columns to Python ints; no per-row casts.
+        s = r.get("gene_start_idx", 0)
+        e = r.get("gene_end_idx", 0)
+        if s != expect or len(rseq) != e - s + 1:
+            return None
+        seqs.append(rseq)
+        expect = e + 1
+    return seqs if expect == gene_len else None
+
+
+def _reference_gene_packed(
+    gene_id: str,
+    gene_len: int,
+    regions: Optional[Sequence[Dict[str, Any]]] = None,
+) -> Tuple[PackedSequence, Optional[str]]:
+    """(cached packed sequence, freshly built str or None on a cache hit)."""
+    key = (str(gene_id), int(gene_len))
+    now = time.monotonic()
+    entry = sequence_cache.get(key)
+    if entry is not None:
+        stamp, packed, verified_at = entry
+        if now - verified_at < settings.RESPONSE_CACHE_TTL_SECONDS:
+            return packed, None
+        current = region_repo.get_regions_stamp(gene_id)
+        if current == stamp:
+            sequence_cache.set(key, (stamp, packed, now))
+            return packed, None
+    else:
+        current = region_repo.get_regions_stamp(gene_id)
+
+    if regions is None:
+        regions = region_repo.list_regions_by_gene(gene_id, include_sequence=True)
+    seq = build_gene_sequence(gene_len, list(regions))
+    packed = PackedSequence(seq)
+    sequence_cache.set(key, (current, packed, now))
+    return packed, seq
+
+
+def get_reference_gene_sequence(
+    gene_id: str,
+    gene_len: int,
+    regions: Optional[Sequence[Dict[str, Any]]] = None,
+) -> str:
+    """Return the assembled reference sequence for ``gene_id`` (cached per worker).
+
+    ``regions`` may be passed when the caller already fetched the rows with
+    sequences; otherwise they are loaded on a cache miss. After
+    RESPONSE_CACHE_TTL_SECONDS a cached entry is revalidated against the
+    regions' (max updated_at, count) stamp instead of being rebuilt. The
+    cache holds 2-bit packed sequences; callers that only need part of the
+    gene should use :func:`get_reference_gene_span`.
+    """
+    packed, seq = _reference_gene_packed(gene_id, gene_len, regions)
+    return seq if seq is not None else str(packed)
+
+
+def get_reference_gene_span(gene_id: str, gene_len: int, start_gene0: int, end_gene0: int) -> bytearray:
+    """Reference positions [start_gene0, end_gene0) as a fresh ASCII buffer.
+
+    Positions outside the gene are ``N``. Only the requested span is
+    unpacked from the cached gene; the caller owns (and may edit) the buffer.
+    """
+    packed, _ = _reference_gene_packed(gene_id, gene_len)
+    return packed.span_buffer(start_gene0, end_gene0)
+
+
+def build_sequence_span(span_start: int, span_end: int, regions: List[Dict[str, Any]]) -> str:
+    """Assemble gene0 positions [span_start, span_end) from region rows.
+
+    Same semantics as :func:`build_gene_sequence`, but only the requested span
+    is materialized, so callers that need a window can fetch just the regions
+    overlapping it.
+    """
+    return sequence_span_buffer(span_start, span_end, regions).decode("ascii")
+
+
+def sequence_span_buffer(span_start: int, span_end: int, regions: List[Dict[str, Any]]) -> bytearray:
+    """:func:`build_sequence_span` as an uppercase ASCII ``bytearray``.
+
+    Positions not covered by any region (including those before gene0 0 or
+    past the gene end) are ``N``, so a padded window is one call.
+    """
+    span_start = int(span_start)
+    span_len = max(0, int(span_end) - span_start)
+    # ASCII byte buffer: region chunks are copied with one memmove each instead
+    # of being exploded into per-character str objects.
+    seq = bytearray(b"N") * span_len
     for r in regions:
-        rseq = (r.get("sequence") or "").upper()
+        # Slice before touching the bases: a window may need a few hundred
+        # bases of a region that is hundreds of kb long.
+        rseq = r.get("sequence") or ""
         if not rseq:
             continue
-        s = int(r.get("gene_start_idx", 0))
-        e = int(r.get("gene_end_idx", 0))
+        s = r.get("gene_start_idx", 0)
+        e = r.get("gene_end_idx", 0)
         if e < s:
             continue
 
@@ -46,8 +168,8 @@ def build_gene_sequence(gene_len: int, regions: List[Dict[str, Any]]) -> str:
             rseq = rseq[:usable]
             e = s + usable - 1
 
-        s2 = max(0, s)
-        e2 = min(int(gene_len) - 1, e)
+        s2 = max(span_start, s)
+        e2 = min(span_start + span_len - 1, e)
         if e2 < s2:
             continue
 
@@ -55,17 +177,76 @@ def build_gene_sequence(gene_len: int, regions: List[Dict[str, Any]]) -> str:
         chunk = rseq[offset : offset + (e2 - s2 + 1)]
         if not chunk:
             continue
-        seq[s2 : e2 + 1] = list(chunk)
-    return "".join(seq)
+        seq[s2 - span_start : e2 - span_start + 1] = chunk.encode("ascii", "replace")
+    return seq.upper()
+
+
+def _region_start(r: Dict[str, Any]) -> int:
+    return int(r["gene_start_idx"])
+
+
+# Below this many substitutions a bytearray loop beats NumPy's setup cost.
+_NUMPY_PATCH_MIN_EDITS = 32
+
+
+def patch_sequence(seq: str, substitutions: Dict[int, str]) -> str:
+    """Return ``seq`` with single-base substitutions ``{pos0: base}`` applied.
+
+    Positions outside the sequence are ignored. Callers build ``substitutions``
+    in application order, so later edits at the same position win.
+    """
+    if not substitutions:
+        return seq
+    n = len(seq)
+    if len(substitutions) < _NUMPY_PATCH_MIN_EDITS:
+        buf = bytearray(seq, "ascii")
+        for pos, base in substitutions.items():
+            if 0 <= pos < n:
+                buf[pos] = ord(base)
+        return buf.decode("ascii")
+
+    arr = np.frombuffer(seq.encode("ascii"), dtype=np.uint8).copy()
+    pos = np.fromiter(substitutions.keys(), dtype=np.int64, count=len(substitutions))
+    bases = np.frombuffer("".join(substitutions.values()).encode("ascii"), dtype=np.uint8)
+    keep = (pos >= 0) & (pos < n)
+    arr[pos[keep]] = bases[keep]
+    return arr.tobytes().decode("ascii")
+
+
+class RegionIndex(NamedTuple):
+    """Coordinate-only region rows of one gene with their gene0 bounds.
+
+    ``rows`` are shared between requests through ``region_cache``: treat them
+    as read-only and copy any row that needs extra keys.
+    """
+
+    rows: List[Dict[str, Any]]
+    starts: List[int]
+    ends: List[int]
+
+    def find_focus(self, pos_gene0: int) -> Tuple[int, Dict[str, Any]]:
+        i = bisect_right(self.starts, pos_gene0) - 1
+        if i >= 0 and pos_gene0 <= self.ends[i]:
+            return i, self.rows[i]
+        raise ValueError(f"SNV pos_gene0={pos_gene0} not covered by any region")
 
 
-def find_focus_region(regions: List[Dict[str, Any]], pos_gene0: int) -> Tuple[int, Dict[str, Any]]:
-    for i, r in enumerate(regions):
-        s = int(r["gene_start_idx"])
-        e = int(r["gene_end_idx"])
-        if s <= pos_gene0 <= e:
-            return i, r
-    raise ValueError(f"SNV pos_gene0={pos_gene0} not covered by any region")
+def get_region_index(gene_id: str) -> RegionIndex:
+    """Cached :class:`RegionIndex` for ``gene_id`` (rows in gene order)."""
+    key = ("region_index", str(gene_id))
+    index = region_cache.get(key)
+    if index is None:
+        # Rows arrive ordered by gene_start_idx (ORDER BY in the RPC/select);
+        # sort only if that ever stops holding.
+        rows = region_repo.list_regions_by_gene(gene_id, include_sequence=False)
+        starts = [int(r["gene_start_idx"]) for r in rows]
+        if any(a > b for a, b in zip(starts, starts[1:])):
+            rows = sorted(rows, key=_region_start)
+            starts = sorted(starts)
+        index = RegionIndex(rows=rows, starts=starts, ends=[int(r["gene_end_idx"]) for r in rows])
+        if rows:
+            region_cache.set(key, index)
+    return index
 
 
 def pick_regions_with_shift(regions: List[Dict[str, Any]], focus_idx: int, radius: int) -> Tuple[List[Dict[str, Any]], int]:
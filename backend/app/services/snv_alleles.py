@@ -3,11 +3,20 @@ from __future__ import annotations
 
 from typing import Dict, Tuple
 
-_COMP = {"A": "T", "T": "A", "C": "G", "G": "C", "N": "N"}
+# 256-entry complement table (either case in, uppercase out; anything else -> "N").
+_COMP_TABLE = ["N"] * 256
+for _a, _c in zip("ACGT", "TGCA"):
+    _COMP_TABLE[ord(_a)] = _COMP_TABLE[ord(_a.lower())] = _c
+_COMP_TABLE = tuple(_COMP_TABLE)
+del _a, _c
 
 
 def complement_base(b: str) -> str:
-    return _COMP.get((b or "N").upper(), "N")
+    if b and len(b) == 1:
+        o = ord(b)
+        if o < 256:
+            return _COMP_TABLE[o]
+    return "N"
 
 
 def to_gene_direction_alleles(snv_row: Dict, gene_strand: str) -> Tuple[str, str]:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import threading
 from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -9,9 +11,17 @@ import numpy as np
 import torch
 from fastapi import HTTPException
 
-from app.ai_models.spliceai_inference import InferenceConfig, predict_probs_center_crop, safe_float_list
+from app.ai_models.spliceai_inference import (
+    InferenceConfig,
+    predict_probs_center_crop,
+    predict_probs_center_crop_batch,
+    safe_float_list,
+)
 from app.ai_models.spliceai_resblock import load_model
-from app.db.repositories import disease_repo, gene_repo, region_repo, snv_repo, state_repo
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+from app.db.repositories import disease_repo, state_repo
 from app.schemas.splicing import (
     DeltaPeak,
     DeltaSummary,
@@ -21,7 +31,13 @@ from app.schemas.splicing import (
     RegionWithRel,
     SplicingPredictionResponse,
 )
-from app.services.gene_context import build_gene_sequence, find_focus_region, pick_regions_with_shift, resolve_single_gene_id_for_disease
+from app.services.gene_context import (
+    get_reference_gene_span,
+    get_region_index,
+    pick_regions_with_shift,
+    resolve_gene_row,
+    resolve_single_gene_id_for_disease,
+)
 from app.services.snv_alleles import complement_base, to_gene_direction_alleles
 from app.services.state_lineage import collect_effective_state_edits
 from app.services.step3_interpreter import interpret_step3
@@ -46,19 +62,49 @@ def normalize_edit_to_sequence(base_at_pos: str, ref: str, alt: str) -> Tuple[st
     return ref_u, alt_u, False
 
 
-def apply_substitution(seq_list: List[str], idx: int, from_b: str, to_b: str, *, strict: bool) -> bool:
-    if idx < 0 or idx >= len(seq_list):
-        raise IndexError(f"edit idx out of range: {idx} (len={len(seq_list)})")
-    cur = (seq_list[idx] or "N").upper()
+def apply_substitution(seq_buf: bytearray, idx: int, from_b: str, to_b: str, *, strict: bool) -> bool:
+    """Substitute one base in an ASCII sequence buffer; returns whether ``from_b`` matched."""
+    if idx < 0 or idx >= len(seq_buf):
+        raise IndexError(f"edit idx out of range: {idx} (len={len(seq_buf)})")
+    cur = chr(seq_buf[idx]).upper()
     fb = (from_b or "N").upper()
     tb = (to_b or "N").upper()
     ok = cur == fb
     if strict and not ok:
         return False
-    seq_list[idx] = tb
+    seq_buf[idx] = ord(tb[0])
     return ok
 
 
+# Byte lookup tables for the vectorized (non-strict) edit path.
+_UPPER_LUT = np.arange(256, dtype=np.uint8)
+_UPPER_LUT[ord("a") : ord("z") + 1] -= 32
+_COMP_LUT = np.full(256, ord("N"), dtype=np.uint8)
+for _b in "ACGTN":
+    _COMP_LUT[ord(_b)] = _COMP_LUT[ord(_b.lower())] = ord(complement_base(_b))
+del _b
+
+# Below this many edits the per-edit Python loop beats NumPy's setup cost.
+_VECTOR_EDIT_MIN_EDITS = 32
+
+
+def apply_substitutions_unchecked(seq_buf: bytearray, idxs: List[int], from_bases: bytes, to_bases: bytes) -> None:
+    """Vectorized ``normalize_edit_to_sequence`` + ``apply_substitution(strict=False)``.
+
+    ``idxs`` must be distinct and inside ``seq_buf``: with repeated positions
+    a later edit would have to see the base written by an earlier one.
+    """
+    arr = np.frombuffer(seq_buf, dtype=np.uint8)
+    idx = np.asarray(idxs, dtype=np.int64)
+    base = _UPPER_LUT[arr[idx]]
+    ref = _UPPER_LUT[np.frombuffer(from_bases, dtype=np.uint8)]
+    alt = _UPPER_LUT[np.frombuffer(to_bases, dtype=np.uint8)]
+    # Same rule as normalize_edit_to_sequence: flip to the complement only
+    # when the sequence carries complement(ref) rather than ref itself.
+    flip = (base != ref) & (base == _COMP_LUT[ref])
+    arr[idx] = np.where(flip, _COMP_LUT[alt], alt)
+
+
 # ---------------------------------------------------------------------------
 # Environment / model helpers
 # ---------------------------------------------------------------------------
@@ -105,19 +151,103 @@ def _resolve_model_path(model_path: str) -> str:
     )
 
 
+# Inference is CPU/GPU heavy and runs on the request threadpool; cap how many
+# forward passes run at once so other (DB-bound) routes keep their threads.
+_inference_slots = threading.BoundedSemaphore(max(1, int(settings.SPLICEAI_MAX_CONCURRENT_INFERENCES)))
+
+# Many states share the same model input (notably the reference sequence), so
+# probabilities are cached by content hash and identical in-flight requests
+# share a single forward pass.
+_prediction_cache = TTLCache(
+    maxsize=settings.SPLICEAI_PREDICTION_CACHE_SIZE,
+    ttl=settings.SPLICEAI_PREDICTION_CACHE_TTL_SECONDS,
+)
+_prediction_flight = SingleFlight()
+
+
 @lru_cache(maxsize=1)
 def get_spliceai_model() -> torch.nn.Module:
+    if settings.SPLICEAI_TORCH_THREADS > 0:
+        torch.set_num_threads(int(settings.SPLICEAI_TORCH_THREADS))
     model_path = _resolve_model_path(_env("SPLICEAI_MODEL_PATH", "app/ai_models/spliceai_window=10000.pt"))
-    device_str = _resolve_device_str(os.getenv("SPLICEAI_DEVICE"))
-    device = torch.device(device_str)
+    device = torch.device(get_inference_device_str())
     logger.info("Loading SpliceAI model from %s on device=%s", model_path, device)
     return load_model(model_path, device=device)
 
 
+@lru_cache(maxsize=1)
+def get_inference_device_str() -> str:
+    # Device availability does not change at runtime; probe CUDA/MPS once.
+    return _resolve_device_str(os.getenv("SPLICEAI_DEVICE"))
+
+
+@lru_cache(maxsize=1)
+def get_inference_config() -> InferenceConfig:
+    return InferenceConfig(device=get_inference_device_str(), autocast_dtype=settings.SPLICEAI_AUTOCAST_DTYPE)
+
+
 def get_model_version() -> str:
     return _env("SPLICEAI_MODEL_VERSION", "spliceai10k_custom_v1")
 
 
+def _prediction_key(seq: str, *, in_length: int, out_length: int) -> str:
+    h = hashlib.blake2b(seq.encode("ascii", "replace"), digest_size=16)
+    # Mixed precision changes the probabilities, so it is part of the key.
+    h.update(f"|{in_length}|{out_length}|{get_model_version()}|{settings.SPLICEAI_AUTOCAST_DTYPE or ''}".encode())
+    return h.hexdigest()
+
+
+def predict_probs_cached(model: torch.nn.Module, seq: str, *, in_length: int, out_length: int, cfg: InferenceConfig) -> np.ndarray:
+    key = _prediction_key(seq, in_length=in_length, out_length=out_length)
+    hit = _prediction_cache.get(key)
+    if hit is not None:
+        return hit
+
+    def _run() -> np.ndarray:
+        with _inference_slots:
+            probs = predict_probs_center_crop(model, seq, in_length=in_length, out_length=out_length, cfg=cfg)
+        probs.setflags(write=False)  # shared between requests
+        _prediction_cache.set(key, probs)
+        return probs
+
+    return _prediction_flight.do(key, _run)
+
+
+def predict_probs_pair_cached(
+    model: torch.nn.Module,
+    ref_seq: str,
+    alt_seq: str,
+    *,
+    in_length: int,
+    out_length: int,
+    cfg: InferenceConfig,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """REF and ALT probabilities, sharing one (2,4,L) forward pass on a double miss.
+
+    Same caching as :func:`predict_probs_cached`; when either side is
+    already cached (or both inputs are identical) each side goes through it.
+    """
+    ref_key = _prediction_key(ref_seq, in_length=in_length, out_length=out_length)
+    alt_key = _prediction_key(alt_seq, in_length=in_length, out_length=out_length)
+    if ref_key == alt_key or _prediction_cache.get(ref_key) is not None or _prediction_cache.get(alt_key) is not None:
+        return (
+            predict_probs_cached(model, ref_seq, in_length=in_length, out_length=out_length, cfg=cfg),
+            predict_probs_cached(model, alt_seq, in_length=in_length, out_length=out_length, cfg=cfg),
+        )
+
+    def _run() -> Tuple[np.ndarray, np.ndarray]:
+        with _inference_slots:
+            batch = predict_probs_center_crop_batch(
+                model, [ref_seq, alt_seq], in_length=in_length, out_length=out_length, cfg=cfg
+            )
+        batch.setflags(write=False)  # shared between requests
+        _prediction_cache.set(ref_key, batch[0])
+        _prediction_cache.set(alt_key, batch[1])
+        return batch[0], batch[1]
+
+    return _prediction_flight.do((ref_key, alt_key), _run)
+
+
 # ---------------------------------------------------------------------------
 # Response metadata helpers
 # ---------------------------------------------------------------------------
@@ -221,9 +351,11 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
     if not disease_id:
         raise HTTPException(status_code=500, detail="user_state.disease_id is missing")
 
-    disease = disease_repo.get_disease(disease_id)
-    if not disease:
+    # disease + gene + representative SNV in a single PostgREST call.
+    bundle = disease_repo.get_disease_bundle(disease_id, include_window=False)
+    if not bundle:
         raise HTTPException(status_code=404, detail=f"disease not found: {disease_id}")
+    disease, embedded_gene, snv = bundle["disease"], bundle["gene"], bundle["snv"]
     _assert_step3_enabled(disease_id, disease)
 
     try:
@@ -231,7 +363,7 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    gene = gene_repo.get_gene(gene_id)
+    gene = resolve_gene_row(gene_id, embedded_gene)
     if not gene:
         raise HTTPException(status_code=404, detail=f"gene not found: {gene_id}")
 
@@ -245,7 +377,6 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
         gene_exon_count = None
     gene_strand = str(gene.get("strand") or "+")
 
-    snv = snv_repo.get_representative_snv(disease_id)
     if not snv:
         raise HTTPException(status_code=404, detail=f"representative SNV not found for disease_id={disease_id}")
     pos_gene0 = int(snv["pos_gene0"])
@@ -253,12 +384,13 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
     snv_ref_display = str(snv.get("ref") or snv_ref_gene)
     snv_alt_display = str(snv.get("alt") or snv_alt_gene)
 
-    regions = region_repo.list_regions_by_gene(gene_id, include_sequence=True)
-    if not regions:
+    # Coordinates only: sequences come from the cached reference assembly.
+    index = get_region_index(gene_id)
+    if not index.rows:
         raise HTTPException(status_code=404, detail=f"No regions found for gene_id={gene_id}")
 
-    focus_idx, focus_region = find_focus_region(regions, pos_gene0)
-    target_regions, target_start_idx = pick_regions_with_shift(regions, focus_idx, int(req.region_radius))
+    focus_idx, focus_region = index.find_focus(pos_gene0)
+    target_regions, target_start_idx = pick_regions_with_shift(index.rows, focus_idx, int(req.region_radius))
 
     target_start = int(target_regions[0]["gene_start_idx"])
     target_end = int(target_regions[-1]["gene_end_idx"]) + 1  # exclusive
@@ -266,8 +398,6 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
         raise HTTPException(status_code=500, detail="Invalid target span")
     target_len = target_end - target_start
 
-    gene_seq = build_gene_sequence(gene_len, regions)
-
     flank = int(req.flank)
     input_start_gene0 = target_start - flank
     input_end_gene0 = target_end + flank
@@ -275,11 +405,11 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
     if input_len <= 0:
         raise HTTPException(status_code=500, detail="Invalid input span")
 
-    pad_left = max(0, -input_start_gene0)
-    pad_right = max(0, input_end_gene0 - gene_len)
-    in_start_clamped = max(0, input_start_gene0)
-    in_end_clamped = min(gene_len, input_end_gene0)
-    input_seq = ("N" * pad_left) + gene_seq[in_start_clamped:in_end_clamped] + ("N" * pad_right)
+    # Only the model input span is unpacked from the cached gene; positions
+    # beyond either gene end come back as "N" padding. The buffer becomes the
+    # ALT input once the REF str has been decoded from it.
+    alt_buf = get_reference_gene_span(gene_id, gene_len, input_start_gene0, input_end_gene0)
+    input_seq = alt_buf.decode("ascii")
     if len(input_seq) != input_len:
         raise HTTPException(status_code=500, detail=f"input_seq length mismatch: got {len(input_seq)} expected {input_len}")
 
@@ -300,7 +430,6 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
         warnings.append(f"Input span includes {n_count} padded/uncovered base(s) represented as 'N'.")
 
     ref_input = input_seq
-    alt_list = list(input_seq)
 
     def idx_in_input(pos0: int) -> int:
         return int(pos0 - input_start_gene0)
@@ -309,9 +438,9 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
     representative_snv_applied = False
     if req.include_disease_snv and seed_mode != "reference_is_current":
         idx = idx_in_input(pos_gene0)
-        base_at = alt_list[idx] if 0 <= idx < len(alt_list) else "N"
+        base_at = chr(alt_buf[idx]) if 0 <= idx < len(alt_buf) else "N"
         ref_n, alt_n, _ = normalize_edit_to_sequence(base_at, snv_ref_gene, snv_alt_gene)
-        ok = apply_substitution(alt_list, idx, ref_n, alt_n, strict=req.strict_ref_check)
+        ok = apply_substitution(alt_buf, idx, ref_n, alt_n, strict=req.strict_ref_check)
         if req.strict_ref_check and not ok:
             raise HTTPException(
                 status_code=400,
@@ -333,29 +462,44 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
         ]
         warnings.append(f"Applied {len(req.edits_override)} request-time override edit(s) after the stored state lineage.")
 
-    ignored_outside_input = 0
+    in_input: List[Tuple[int, Dict[str, Any]]] = []
     for e in effective_edits_raw:
         idx = idx_in_input(int(e["pos"]))
-        if idx < 0 or idx >= len(alt_list):
-            ignored_outside_input += 1
-            continue
-        base_at = alt_list[idx]
-        ref_n, alt_n, _ = normalize_edit_to_sequence(base_at, e["from"], e["to"])
-        ok = apply_substitution(alt_list, idx, ref_n, alt_n, strict=req.strict_ref_check)
-        if req.strict_ref_check and not ok:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Edit ref mismatch at pos_gene0={e['pos']} (expected {ref_n}, saw {base_at})",
-            )
+        if 0 <= idx < len(alt_buf):
+            in_input.append((idx, e))
+    ignored_outside_input = len(effective_edits_raw) - len(in_input)
+
+    if (
+        not req.strict_ref_check
+        and len(in_input) >= _VECTOR_EDIT_MIN_EDITS
+        and len({idx for idx, _ in in_input}) == len(in_input)
+    ):
+        apply_substitutions_unchecked(
+            alt_buf,
+            [idx for idx, _ in in_input],
+            "".join((e["from"] or "N")[:1] for _, e in in_input).encode("ascii", "replace"),
+            "".join((e["to"] or "N")[:1] for _, e in in_input).encode("ascii", "replace"),
+        )
+    else:
+        for idx, e in in_input:
+            base_at = chr(alt_buf[idx])
+            ref_n, alt_n, _ = normalize_edit_to_sequence(base_at, e["from"], e["to"])
+            ok = apply_substitution(alt_buf, idx, ref_n, alt_n, strict=req.strict_ref_check)
+            if req.strict_ref_check and not ok:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Edit ref mismatch at pos_gene0={e['pos']} (expected {ref_n}, saw {base_at})",
+                )
     if ignored_outside_input:
         warnings.append(f"Ignored {ignored_outside_input} effective edit(s) outside the current model input span.")
 
-    alt_input = "".join(alt_list)
+    alt_input = alt_buf.decode("ascii")
 
     model = get_spliceai_model()
-    cfg = InferenceConfig(device=_resolve_device_str(os.getenv("SPLICEAI_DEVICE")))
-    prob_ref = predict_probs_center_crop(model, ref_input, in_length=input_len, out_length=target_len, cfg=cfg)
-    prob_alt = predict_probs_center_crop(model, alt_input, in_length=input_len, out_length=target_len, cfg=cfg)
+    cfg = get_inference_config()
+    prob_ref, prob_alt = predict_probs_pair_cached(
+        model, ref_input, alt_input, in_length=input_len, out_length=target_len, cfg=cfg
+    )
 
     focus_brief = _to_region_brief(focus_region)
     target_models: List[RegionWithRel] = []
@@ -364,7 +508,7 @@ def predict_splicing_for_state(state_id: str, req: PredictSplicingRequest) -> Sp
         target_models.append(RegionWithRel(**_to_region_brief(r).model_dump(), rel=rel))
 
     snv_idx_in_target = int(pos_gene0 - target_start)
-    target_seq_ref_full = gene_seq[target_start:target_end]
+    target_seq_ref_full = ref_input[flank : flank + target_len]
     target_seq_alt_full = alt_input[flank : flank + target_len]
     target_seq_ref = target_seq_ref_full if req.return_target_sequence else None
     target_seq_alt = target_seq_alt_full if req.return_target_sequence else None
@@ -43,6 +43,9 @@ def load_parent_chain_rows(parent_state_id: Optional[str], *, disease_id: str) -
 
     The chain is validated for cycles and disease consistency.
     """
+    # Whole chain in one round-trip; the walk below then reads from cache.
+    state_repo.prefetch_state_lineage(parent_state_id)
+
     seen = set()
     rows: List[Dict[str, Any]] = []
     cur = parent_state_id
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, Optional
 
 from fastapi import HTTPException
 
-from app.db.repositories import disease_repo, gene_repo, region_repo, state_repo, snv_repo
-from app.schemas.state import AppliedEdit, CreateStateRequest, StatePublic
-from app.services.gene_context import build_gene_sequence, resolve_single_gene_id_for_disease
+from app.db.repositories import disease_repo, state_repo
+from app.schemas.state import AppliedEdit, CreateStateRequest, Edit, StatePublic
+from app.services.gene_context import (
+    get_reference_gene_sequence,
+    patch_sequence,
+    resolve_gene_row,
+    resolve_single_gene_id_for_disease,
+)
 from app.services.state_lineage import load_parent_chain_edits
 from app.services.snv_alleles import to_gene_direction_alleles
 
-_ALLOWED = {"A", "C", "G", "T", "N"}
+_ALLOWED: frozenset[str] = frozenset("ACGTN")
+
+# 256-entry table: byte of an allowed base (either case) -> uppercase byte, else 0.
+_BASE_BYTE = bytes(ord(chr(c).upper()) if chr(c).upper() in _ALLOWED else 0 for c in range(256))
+
+
+# str.translate table deleting every allowed base (either case): whatever
+# survives a translate is an invalid base.
+_DROP_ALLOWED = str.maketrans("", "", "ACGTNacgtn")
+
+
+def _base_byte(v: object) -> int:
+    """Uppercase ASCII byte for a single allowed base, or 0 if ``v`` is not one."""
+    if isinstance(v, str) and len(v) == 1:
+        o = ord(v)
+        return _BASE_BYTE[o] if o < 256 else 0
+    return 0
 
 
 def _normalize_applied_edit(applied: Optional[AppliedEdit]) -> dict:
@@ -18,7 +39,8 @@ def _normalize_applied_edit(applied: Optional[AppliedEdit]) -> dict:
         return {"type": "user", "edits": []}
     edits = []
     for e in applied.edits:
-        edits.append({"pos": int(e.pos_gene0), "from": e.from_base.upper(), "to": e.to_base.upper()})
+        # Case is folded by the byte table during validation.
+        edits.append({"pos": int(e.pos_gene0), "from": e.from_base, "to": e.to_base})
     return {"type": applied.type, "edits": edits}
 
 
@@ -29,23 +51,19 @@ def _current_sequence_for_edits(
     gene_strand: str,
     gene_len: int,
     parent_state_id: Optional[str],
-) -> List[str]:
-    regions = region_repo.list_regions_by_gene(gene_id, include_sequence=True)
-    seq = list(build_gene_sequence(gene_len, regions))
+    rep: Optional[dict],
+) -> bytearray:
+    ref_seq = get_reference_gene_sequence(gene_id, gene_len)
 
+    subs: Dict[int, str] = {}
     seed_mode = str(disease_row.get("seed_mode") or "apply_alt")
-    rep = snv_repo.get_representative_snv(disease_id)
     if rep is not None and seed_mode != "reference_is_current":
-        pos = int(rep["pos_gene0"])
-        if 0 <= pos < len(seq):
-            _, alt_gene = to_gene_direction_alleles(rep, gene_strand)
-            seq[pos] = alt_gene
+        _, alt_gene = to_gene_direction_alleles(rep, gene_strand)
+        subs[int(rep["pos_gene0"])] = alt_gene
 
     for e in load_parent_chain_edits(parent_state_id, disease_id=disease_id):
-        pos = e["pos"]
-        if 0 <= pos < len(seq):
-            seq[pos] = e["to"]
-    return seq
+        subs[e["pos"]] = e["to"]
+    return bytearray(patch_sequence(ref_seq, subs), "ascii")
 
 
 def _validate_request_edits(
@@ -56,29 +74,39 @@ def _validate_request_edits(
     gene_id: str,
     gene_strand: str,
     gene_len: int,
+    rep_snv: Optional[dict],
 ) -> dict:
     applied = _normalize_applied_edit(req.applied_edit)
-    current_seq = _current_sequence_for_edits(disease_id, disease_row, gene_id, gene_strand, gene_len, req.parent_state_id)
+    current_seq = _current_sequence_for_edits(
+        disease_id, disease_row, gene_id, gene_strand, gene_len, req.parent_state_id, rep_snv
+    )
 
-    seen_pos = set()
-    cleaned = []
-    for raw in applied["edits"]:
-        pos = int(raw["pos"])
-        fb = str(raw["from"]).upper()
-        tb = str(raw["to"]).upper()
+    edits = applied["edits"]
+    # One translate over every from/to base (schema guarantees length 1);
+    # the per-edit scan below only runs to name the offending edit.
+    if "".join([e["from"] + e["to"] for e in edits]).translate(_DROP_ALLOWED):
+        for raw in edits:
+            if not _base_byte(raw["from"]) or not _base_byte(raw["to"]):
+                raise HTTPException(status_code=400, detail=f"Edit base must be one of {sorted(_ALLOWED)}: {raw}")
+
+    # pos -> cleaned edit; a key collision is a duplicate position.
+    cleaned: Dict[int, dict] = {}
+    for raw in edits:
+        pos = raw["pos"]
+        fb_b = _BASE_BYTE[ord(raw["from"])]
+        tb_b = _BASE_BYTE[ord(raw["to"])]
 
         if pos < 0 or pos >= gene_len:
             raise HTTPException(status_code=400, detail=f"Edit pos out of range: {pos} (gene_length={gene_len})")
-        if fb not in _ALLOWED or tb not in _ALLOWED:
-            raise HTTPException(status_code=400, detail=f"Edit base must be one of {_ALLOWED}: {raw}")
-        if fb == tb:
+        if fb_b == tb_b:
             raise HTTPException(status_code=400, detail=f"Edit from/to must differ: {raw}")
-        if pos in seen_pos:
+        if pos in cleaned:
             raise HTTPException(status_code=400, detail=f"Duplicate edit position: {pos}")
-        seen_pos.add(pos)
 
-        cur = current_seq[pos].upper()
-        if cur != fb:
+        fb = chr(fb_b)
+        tb = chr(tb_b)
+        if current_seq[pos] != fb_b:
+            cur = chr(current_seq[pos]).upper()
             raise HTTPException(
                 status_code=400,
                 detail={
@@ -92,22 +120,33 @@ def _validate_request_edits(
                 },
             )
 
-        cleaned.append({"pos": pos, "from": fb, "to": tb})
-        current_seq[pos] = tb
-    return {"type": applied["type"], "edits": cleaned}
+        cleaned[pos] = {"pos": pos, "from": fb, "to": tb}
+        current_seq[pos] = tb_b
+    return {"type": applied["type"], "edits": list(cleaned.values())}
+
+
+def _applied_edit_from_cleaned(applied: dict) -> AppliedEdit:
+    # ``applied`` was just validated by _validate_request_edits (and is what was
+    # inserted), so build the response model without a second validation pass.
+    return AppliedEdit.model_construct(
+        type=applied["type"],
+        edits=[Edit.model_construct(pos_gene0=e["pos"], from_base=e["from"], to_base=e["to"]) for e in applied["edits"]],
+    )
 
 
 def create_state_for_disease(disease_id: str, req: CreateStateRequest) -> StatePublic:
-    disease = disease_repo.get_disease(disease_id)
-    if not disease:
+    # disease + gene + representative SNV in a single PostgREST call.
+    bundle = disease_repo.get_disease_bundle(disease_id, include_window=False)
+    if not bundle:
         raise HTTPException(status_code=404, detail=f"disease not found: {disease_id}")
+    disease, embedded_gene = bundle["disease"], bundle["gene"]
 
     try:
         gene_id = resolve_single_gene_id_for_disease(disease_id, disease)
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    gene = gene_repo.get_gene(gene_id)
+    gene = resolve_gene_row(gene_id, embedded_gene)
     if not gene:
         raise HTTPException(status_code=404, detail=f"gene not found: {gene_id}")
 
@@ -123,6 +162,7 @@ def create_state_for_disease(disease_id: str, req: CreateStateRequest) -> StateP
         gene_id=gene_id,
         gene_strand=gene_strand,
         gene_len=gene_len,
+        rep_snv=bundle["snv"],
     )
     row = state_repo.create_state(disease_id, gene_id=gene_id, applied_edit=applied, parent_state_id=req.parent_state_id)
 
@@ -130,7 +170,7 @@ def create_state_for_disease(disease_id: str, req: CreateStateRequest) -> StateP
         state_id=str(row.get("state_id")),
         disease_id=str(row.get("disease_id")),
         parent_state_id=row.get("parent_state_id"),
-        applied_edit=AppliedEdit.model_validate(row.get("applied_edit") or applied),
+        applied_edit=_applied_edit_from_cleaned(applied),
         created_at=row.get("created_at"),
     )
 
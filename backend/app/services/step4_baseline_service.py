@@ -8,7 +8,7 @@ from app.db.repositories import disease_repo, gene_repo, state_repo
 from app.db.repositories.step4_baseline_repo import list_protein_references_by_gene, list_structure_assets
 from app.schemas.step4 import Step4BaselineProteinPublic, Step4BaselineResponse, Step4StructureAssetPublic
 from app.services.gene_context import resolve_single_gene_id_for_disease
-from app.services.storage_service import create_signed_storage_url
+from app.services.storage_service import create_signed_storage_urls
 
 
 def _rank_validation_status(status: Optional[str]) -> int:
@@ -76,10 +76,15 @@ def _protein_public(row: Dict[str, Any], *, include_sequences: bool) -> Step4Bas
 
 
 
-def _structure_public(row: Dict[str, Any]) -> Step4StructureAssetPublic:
-    bucket = str(row.get("storage_bucket") or "")
-    path = row.get("storage_path")
-    signed_url, expires = create_signed_storage_url(bucket, path) if bucket and path else (None, None)
+def _structure_bucket_path(row: Dict[str, Any]) -> Tuple[str, str]:
+    return str(row.get("storage_bucket") or ""), str(row.get("storage_path") or "")
+
+
+def _structure_public(
+    row: Dict[str, Any],
+    signed: Dict[Tuple[str, str], Tuple[Optional[str], Optional[int]]],
+) -> Step4StructureAssetPublic:
+    signed_url, expires = signed.get(_structure_bucket_path(row), (None, None))
     return Step4StructureAssetPublic(
         structure_asset_id=str(row.get("structure_asset_id")),
         provider=str(row.get("provider") or "unknown"),
@@ -129,7 +134,9 @@ def _build_step4_baseline_response(
     protein_rows = list_protein_references_by_gene(gene_id, include_sequences=include_sequences)
     protein_row = _choose_best_protein_reference(protein_rows)
     structure_rows = list_structure_assets(str(protein_row["protein_reference_id"]))
-    structures_public = [_structure_public(r) for r in structure_rows]
+    # Sign every structure file in one storage call instead of one per row.
+    signed = create_signed_storage_urls(_structure_bucket_path(r) for r in structure_rows)
+    structures_public = [_structure_public(r, signed) for r in structure_rows]
 
     default_structure_asset_id = None
     for s in structures_public:
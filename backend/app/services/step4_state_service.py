@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 from fastapi import HTTPException
 
 from app.core.config import get_settings
-from app.db.repositories import disease_repo, gene_repo, region_repo, state_repo
+from app.db.repositories import disease_repo, region_repo, state_repo
 from app.db.repositories.step4_baseline_repo import list_structure_assets
 from app.db.repositories.structure_job_repo import find_jobs_by_user_protein_sha, get_job, list_jobs_for_state
 from app.schemas.splicing import PredictSplicingRequest, Step3SplicingEvent
@@ -25,7 +25,7 @@ from app.schemas.step4 import (
     Step4TranslationSanityPublic,
     Step4UserTrackPublic,
 )
-from app.services.gene_context import build_gene_sequence, resolve_single_gene_id_for_disease
+from app.services.gene_context import get_reference_gene_sequence, resolve_gene_row, resolve_single_gene_id_for_disease
 from app.services.protein_translation import (
     compare_sequences,
     first_stop_codon_end_1,
@@ -39,7 +39,7 @@ from app.services.snv_alleles import to_gene_direction_alleles
 from app.services.state_lineage import collect_effective_state_edits
 from app.services.step4_baseline_service import get_step4_baseline_for_state
 from app.services.step4_validation import build_canonical_mrna_from_region_rows
-from app.services.storage_service import create_signed_storage_url
+from app.services.storage_service import create_signed_storage_urls
 
 
 @dataclass
@@ -80,7 +80,7 @@ def _get_state_disease_gene(state_id: str) -> Tuple[Dict[str, Any], Dict[str, An
     disease_id = str(srow.get("disease_id") or "")
     if not disease_id:
         raise HTTPException(status_code=500, detail="user_state.disease_id is missing")
-    drow = disease_repo.get_disease(disease_id)
+    drow, embedded_gene = disease_repo.get_disease_with_gene(disease_id)
     if not drow:
         raise HTTPException(status_code=404, detail=f"disease not found: {disease_id}")
     gene_id = str(srow.get("gene_id") or "")
@@ -89,7 +89,7 @@ def _get_state_disease_gene(state_id: str) -> Tuple[Dict[str, Any], Dict[str, An
             gene_id = resolve_single_gene_id_for_disease(disease_id, drow)
         except ValueError as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
-    grow = gene_repo.get_gene(gene_id)
+    grow = resolve_gene_row(gene_id, embedded_gene)
     if not grow:
         raise HTTPException(status_code=404, detail=f"gene not found: {gene_id}")
     return srow, drow, grow
@@ -136,8 +136,8 @@ def _build_current_gene_sequence(
     if gene_len <= 0:
         raise HTTPException(status_code=500, detail="gene.length is missing/invalid")
 
-    base_seq = build_gene_sequence(gene_len, list(region_rows))
-    seq_list = list(base_seq)
+    base_seq = get_reference_gene_sequence(str(gene_row.get("gene_id") or ""), gene_len, region_rows)
+    seq_buf = bytearray(base_seq, "ascii")
     warnings: List[str] = []
 
     representative_snv_applied = False
@@ -147,10 +147,10 @@ def _build_current_gene_sequence(
     if snv and seed_mode != "reference_is_current":
         pos_gene0 = int(snv["pos_gene0"])
         snv_ref_gene, snv_alt_gene = to_gene_direction_alleles(snv, str(gene_row.get("strand") or "+"))
-        if 0 <= pos_gene0 < len(seq_list):
-            base_at = seq_list[pos_gene0]
+        if 0 <= pos_gene0 < len(seq_buf):
+            base_at = chr(seq_buf[pos_gene0])
             ref_n, alt_n, _ = normalize_edit_to_sequence(base_at, snv_ref_gene, snv_alt_gene)
-            ok = apply_substitution(seq_list, pos_gene0, ref_n, alt_n, strict=False)
+            ok = apply_substitution(seq_buf, pos_gene0, ref_n, alt_n, strict=False)
             if not ok:
                 warnings.append(
                     f"Representative SNV expected {ref_n} at pos_gene0={pos_gene0} but saw {base_at}; applied non-strict substitution."
@@ -162,18 +162,18 @@ def _build_current_gene_sequence(
     effective_edits, lineage_ids = collect_effective_state_edits(state_row, include_parent_chain=True)
     for e in effective_edits:
         pos = int(e.get("pos"))
-        if pos < 0 or pos >= len(seq_list):
+        if pos < 0 or pos >= len(seq_buf):
             warnings.append(f"Ignored effective edit outside gene bounds at pos_gene0={pos}.")
             continue
-        base_at = seq_list[pos]
+        base_at = chr(seq_buf[pos])
         ref_n, alt_n, _ = normalize_edit_to_sequence(base_at, str(e.get("from") or "N"), str(e.get("to") or "N"))
-        ok = apply_substitution(seq_list, pos, ref_n, alt_n, strict=False)
+        ok = apply_substitution(seq_buf, pos, ref_n, alt_n, strict=False)
         if not ok:
             warnings.append(
                 f"Stored edit expected {ref_n} at pos_gene0={pos} but saw {base_at}; applied non-strict substitution."
             )
 
-    return "".join(seq_list), effective_edits, lineage_ids, representative_snv_applied, warnings
+    return seq_buf.decode("ascii"), effective_edits, lineage_ids, representative_snv_applied, warnings
 
 
 
@@ -509,7 +509,7 @@ def _sequence_comparison(normal_protein_seq: str, user_protein_seq: str) -> Step
 
 
 
-def _viewer_format(file_format: Optional[str]) -> Optional[str]:
+def viewer_format(file_format: Optional[str]) -> Optional[str]:
     fmt = str(file_format or "").strip().lower()
     if not fmt:
         return None
@@ -523,7 +523,7 @@ def _viewer_format(file_format: Optional[str]) -> Optional[str]:
 
 
 
-def _default_structure_asset(structures: Sequence[Step4StructureAssetPublic]) -> Optional[Step4StructureAssetPublic]:
+def default_structure_asset(structures: Sequence[Step4StructureAssetPublic]) -> Optional[Step4StructureAssetPublic]:
     if not structures:
         return None
     for asset in structures:
@@ -533,7 +533,7 @@ def _default_structure_asset(structures: Sequence[Step4StructureAssetPublic]) ->
 
 
 
-def _molstar_target(asset: Optional[Step4StructureAssetPublic]) -> Optional[Step4MolstarTargetPublic]:
+def molstar_target(asset: Optional[Step4StructureAssetPublic]) -> Optional[Step4MolstarTargetPublic]:
     if not asset or not asset.signed_url:
         return None
     return Step4MolstarTargetPublic(
@@ -544,20 +544,26 @@ def _molstar_target(asset: Optional[Step4StructureAssetPublic]) -> Optional[Step
         source_chain_id=asset.source_chain_id,
         title=asset.title,
         url=asset.signed_url,
-        format=asset.viewer_format or _viewer_format(asset.file_format),
+        format=asset.viewer_format or viewer_format(asset.file_format),
     )
 
 
 
-def _asset_public_from_payload(asset: Dict[str, Any]) -> Step4JobAssetPublic:
-    bucket = str(asset.get("bucket") or "")
-    path = str(asset.get("path") or "")
-    url, expires = create_signed_storage_url(bucket, path) if bucket and path else (None, None)
+def _asset_bucket_path(asset: Dict[str, Any]) -> Tuple[str, str]:
+    return str(asset.get("bucket") or ""), str(asset.get("path") or "")
+
+
+def _asset_public_from_payload(
+    asset: Dict[str, Any],
+    signed: Dict[Tuple[str, str], Tuple[Optional[str], Optional[int]]],
+) -> Step4JobAssetPublic:
+    bucket, path = _asset_bucket_path(asset)
+    url, expires = signed.get((bucket, path), (None, None))
     file_format = str(asset.get("file_format") or "bin")
     return Step4JobAssetPublic(
         kind=str(asset.get("kind") or "other"),  # type: ignore[arg-type]
         file_format=file_format,
-        viewer_format=_viewer_format(file_format),
+        viewer_format=viewer_format(file_format),
         bucket=bucket,
         path=path,
         name=(str(asset.get("name")) if asset.get("name") is not None else None),
@@ -570,7 +576,10 @@ def _asset_public_from_payload(asset: Dict[str, Any]) -> Step4JobAssetPublic:
 
 def _job_public(row: Dict[str, Any]) -> Step4StructureJobPublic:
     payload = row.get("result_payload") or {}
-    assets = [_asset_public_from_payload(a) for a in (payload.get("assets") or []) if isinstance(a, dict)]
+    raw_assets = [a for a in (payload.get("assets") or []) if isinstance(a, dict)]
+    # All asset URLs of a job are signed in one storage call.
+    signed = create_signed_storage_urls(_asset_bucket_path(a) for a in raw_assets)
+    assets = [_asset_public_from_payload(a, signed) for a in raw_assets]
     default_asset = next((a for a in assets if a.kind == "structure" and a.is_default), None)
     if default_asset is None:
         default_asset = next((a for a in assets if a.kind == "structure"), None)
@@ -596,7 +605,7 @@ def _job_public(row: Dict[str, Any]) -> Step4StructureJobPublic:
             source_chain_id=None,
             title=default_asset.name or "Predicted structure",
             url=default_asset.signed_url,
-            format=default_asset.viewer_format or _viewer_format(default_asset.file_format),
+            format=default_asset.viewer_format or viewer_format(default_asset.file_format),
         )
     return Step4StructureJobPublic(
         job_id=str(row.get("job_id")),
@@ -695,8 +704,8 @@ def get_step4_for_state(
     comparison = _sequence_comparison(baseline.baseline_protein.protein_seq or "", user_protein_seq)
 
     jobs, latest_job = _hydrate_jobs_for_state(state_id, include_latest_payload=include_latest_job_payload) if hydrate_jobs else ([], None)
-    normalized_structures = [s.model_copy(update={"viewer_format": _viewer_format(s.file_format)}) for s in baseline.structures]
-    default_structure = _default_structure_asset(normalized_structures)
+    normalized_structures = [s.model_copy(update={"viewer_format": viewer_format(s.file_format)}) for s in baseline.structures]
+    default_structure = default_structure_asset(normalized_structures)
     can_reuse_normal_structure = bool(comparison.same_as_normal and normalized_structures)
     recommended_strategy = "reuse_baseline" if can_reuse_normal_structure else "predict_user_structure"
 
@@ -769,7 +778,7 @@ def get_step4_for_state(
         structures=normalized_structures,
         default_structure_asset_id=(default_structure.structure_asset_id if default_structure else baseline.default_structure_asset_id),
         default_structure=default_structure,
-        molstar_default=_molstar_target(default_structure),
+        molstar_default=molstar_target(default_structure),
     )
 
     notes: List[str] = []
@@ -11,7 +11,9 @@ from app.services.step4_sources import _find_unique_subsequence
 def build_canonical_mrna_from_region_rows(region_rows: List[Dict[str, Any]]) -> str:
     exons = [r for r in region_rows if str(r.get("region_type") or "").lower() == "exon"]
     exons_sorted = sorted(exons, key=lambda r: int(r.get("region_number") or 0))
-    return "".join(str(r.get("sequence") or "").upper() for r in exons_sorted)
+    # str.join materializes its argument anyway, so pass a list, and upper-case
+    # the assembled mRNA once instead of copying every exon through upper().
+    return "".join([r.get("sequence") or "" for r in exons_sorted]).upper()
 
 
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import io
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from app.core.config import get_settings
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.fanout import run_concurrently
 from app.db.repositories._helpers import run_with_retry
 from app.db.supabase_client import get_supabase_client
 
@@ -25,19 +27,59 @@ def _split_bucket_and_path(stored_path: str, default_bucket: str) -> Tuple[str,
     return default_bucket, p
 
 
+# Signed URLs are reused until shortly before they expire. The reuse margin
+# covers every layer that can hold a URL after it leaves this cache: the
+# STEP2 payload cache plus the HTTP max-age / stale-while-revalidate window,
+# and clients still get at least min(300, lifetime/10) seconds on top.
+# A lifetime shorter than the margin disables reuse.
+_SIGNED_URL_REUSE_MARGIN_SECONDS = (
+    int(settings.RESPONSE_CACHE_TTL_SECONDS)
+    + int(settings.HTTP_CACHE_MAX_AGE_SECONDS)
+    + int(settings.HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS)
+    + min(300, int(settings.SIGNED_URL_EXPIRES_IN) // 10)
+)
+# Lifetime reported for every signed URL, fresh or reused: the floor that
+# holds for any URL this module hands out (a reused URL is evicted once less
+# than the margin remains). Being constant, it also keeps cached payloads
+# byte-identical (stable ETags).
+_SIGNED_URL_REPORTED_EXPIRES_IN = min(int(settings.SIGNED_URL_EXPIRES_IN), _SIGNED_URL_REUSE_MARGIN_SECONDS)
+# (bucket, object_path) -> url
+_signed_url_cache = TTLCache(
+    maxsize=4096,
+    ttl=int(settings.SIGNED_URL_EXPIRES_IN) - _SIGNED_URL_REUSE_MARGIN_SECONDS,
+)
+
+
+def _cached_signed_url(bucket: str, object_path: str) -> Optional[Tuple[str, int]]:
+    url = _signed_url_cache.get((bucket, object_path))
+    if url is None:
+        return None
+    return url, _SIGNED_URL_REPORTED_EXPIRES_IN
+
+
 def create_signed_storage_url(bucket: str, object_path: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
-    """Create a signed URL for an arbitrary Supabase Storage object."""
+    """Create a signed URL for an arbitrary Supabase Storage object.
+
+    The returned expiry is a guaranteed floor rather than the exact
+    remaining lifetime: min(SIGNED_URL_EXPIRES_IN, reuse margin), reported
+    the same way for freshly signed and reused URLs.
+    """
     if not object_path:
         return None, None
+    hit = _cached_signed_url(bucket, object_path)
+    if hit is not None:
+        return hit
 
     sb = get_supabase_client()
-    expires = int(get_settings().SIGNED_URL_EXPIRES_IN)
+    expires = int(settings.SIGNED_URL_EXPIRES_IN)
     res = run_with_retry(lambda: sb.storage.from_(bucket).create_signed_url(object_path, expires))
     if isinstance(res, dict):
         url = res.get("signedURL") or res.get("signedUrl") or res.get("signed_url")
     else:
         url = getattr(res, "signedURL", None) or getattr(res, "signedUrl", None)
-    return url, expires
+    if url:
+        _signed_url_cache.set((bucket, object_path), url)
+    return url, _SIGNED_URL_REPORTED_EXPIRES_IN
 
 
 def create_signed_url(image_path: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
@@ -45,13 +87,87 @@ def create_signed_url(image_path: Optional[str]) -> Tuple[Optional[str], Optiona
     if not image_path:
         return None, None
 
-    settings = get_settings()
     bucket, obj_path = _split_bucket_and_path(image_path, settings.STEP1_IMAGE_BUCKET)
     if not obj_path:
         return None, None
     return create_signed_storage_url(bucket, obj_path)
 
 
+def create_signed_urls(image_paths: Iterable[Optional[str]]) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+    """Batch variant of :func:`create_signed_url` (one storage call per bucket).
+
+    Returns {stored_image_path: (url, expires_in)}; paths that could not be
+    signed map to (None, None).
+    """
+    by_stored: Dict[str, Tuple[str, str]] = {}
+    for stored in image_paths:
+        if not stored:
+            continue
+        bucket, obj_path = _split_bucket_and_path(stored, settings.STEP1_IMAGE_BUCKET)
+        if obj_path:
+            by_stored[stored] = (bucket, obj_path)
+    signed = create_signed_storage_urls(by_stored.values())
+    return {stored: signed.get(key, (None, None)) for stored, key in by_stored.items()}
+
+
+def create_signed_storage_urls(
+    objects: Iterable[Tuple[str, Optional[str]]],
+) -> Dict[Tuple[str, str], Tuple[Optional[str], Optional[int]]]:
+    """Batch variant of :func:`create_signed_storage_url` for (bucket, object_path) pairs.
+
+    Cache misses are signed with one storage call per bucket, with buckets
+    running concurrently, so a list costs about one round-trip. Returns
+    {(bucket, object_path): (url, expires_in)}; pairs with an empty bucket or
+    path are skipped.
+    """
+    out: Dict[Tuple[str, str], Tuple[Optional[str], Optional[int]]] = {}
+    by_bucket: Dict[str, List[str]] = {}
+    for bucket, obj_path in objects:
+        if not bucket or not obj_path or (bucket, obj_path) in out:
+            continue
+        hit = _cached_signed_url(bucket, obj_path)
+        if hit is not None:
+            out[(bucket, obj_path)] = hit
+        else:
+            paths = by_bucket.setdefault(bucket, [])
+            if obj_path not in paths:
+                paths.append(obj_path)
+
+    if not by_bucket:
+        return out
+
+    results = run_concurrently(*(lambda b=bucket, p=paths: _sign_bucket_batch(b, p) for bucket, paths in by_bucket.items()))
+    for bucket, signed in zip(by_bucket, results):
+        for obj_path, pair in signed.items():
+            out[(bucket, obj_path)] = pair
+    return out
+
+
+def _sign_bucket_batch(bucket: str, paths: List[str]) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+    """Sign ``paths`` of one bucket in a single storage call; keyed by object path."""
+    sb = get_supabase_client()
+    expires = int(settings.SIGNED_URL_EXPIRES_IN)
+    try:
+        res = run_with_retry(lambda: sb.storage.from_(bucket).create_signed_urls(paths, expires))
+    except Exception:
+        # Older storage clients / API errors: sign one by one.
+        return {p: create_signed_storage_url(bucket, p) for p in paths}
+
+    wanted = set(paths)
+    out: Dict[str, Tuple[Optional[str], Optional[int]]] = {p: (None, None) for p in paths}
+    for item in res or []:
+        if isinstance(item, dict):
+            path = item.get("path")
+            url = item.get("signedURL") or item.get("signedUrl") or item.get("signed_url")
+        else:
+            path = getattr(item, "path", None)
+            url = getattr(item, "signedURL", None) or getattr(item, "signedUrl", None)
+        if path in wanted and url:
+            out[path] = (url, _SIGNED_URL_REPORTED_EXPIRES_IN)
+            _signed_url_cache.set((bucket, path), url)
+    return out
+
+
 def upload_bytes_to_storage(
     *,
     bucket: str,
@@ -14,9 +14,19 @@ _COMP = str.maketrans({
 })
 
 
+_BASES = frozenset("ACGTN")
+
+# 256-entry table: code point of an allowed base (either case) -> uppercase base, else "".
+_BASE_TABLE = tuple(chr(c).upper() if chr(c).upper() in _BASES else "" for c in range(256))
+
+
 def normalize_base(base: str) -> str:
+    if isinstance(base, str) and len(base) == 1:
+        o = ord(base)
+        if o < 256 and _BASE_TABLE[o]:
+            return _BASE_TABLE[o]
     s = (base or "").strip().upper()
-    if len(s) != 1 or s not in {"A", "C", "G", "T", "N"}:
+    if s not in _BASES:
         raise ValueError(f"Invalid DNA base: {base!r}")
     return s
 
@@ -0,0 +1,80 @@
+# app/utils/packed_dna.py
+from __future__ import annotations
+
+import numpy as np
+
+# A/C/G/T -> 2-bit code; any other byte is stored as an exception.
+_CODE = np.full(256, 255, dtype=np.uint8)
+for _i, _b in enumerate(b"ACGT"):
+    _CODE[_b] = _i
+del _i, _b
+_BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+class PackedSequence:
+    """Uppercase DNA held at 2 bits per base (4x smaller than a str).
+
+    Bases other than A/C/G/T (N runs, mostly) are kept as sparse
+    (position, byte) exceptions. Sequences where those are common are stored
+    unpacked, since the exception table would outgrow the packing gain.
+    """
+
+    __slots__ = ("length", "_packed", "_exc_pos", "_exc_val", "_raw")
+
+    def __init__(self, seq: str) -> None:
+        raw = seq.encode("ascii", "replace")
+        n = len(raw)
+        codes = _CODE[np.frombuffer(raw, dtype=np.uint8)]
+        exc = np.flatnonzero(codes == 255)
+        self.length = n
+        # ~9 bytes per exception (int64 position + value) vs n/4 packed bytes.
+        if exc.size * 9 > n // 4:
+            self._raw = raw
+            self._packed = self._exc_pos = self._exc_val = None
+            return
+        self._raw = None
+        self._exc_pos = exc
+        self._exc_val = np.frombuffer(raw, dtype=np.uint8)[exc].copy()
+        codes[exc] = 0
+        quads = np.zeros(((n + 3) // 4) * 4, dtype=np.uint8)
+        quads[:n] = codes
+        quads = quads.reshape(-1, 4)
+        self._packed = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+
+    @property
+    def nbytes(self) -> int:
+        if self._raw is not None:
+            return len(self._raw)
+        return int(self._packed.nbytes + self._exc_pos.nbytes + self._exc_val.nbytes)
+
+    def _unpack(self, start: int, end: int) -> np.ndarray:
+        if self._raw is not None:
+            return np.frombuffer(self._raw, dtype=np.uint8)[start:end].copy()
+        p = self._packed[start // 4 : (end + 3) // 4]
+        codes = np.stack(((p >> 6) & 3, (p >> 4) & 3, (p >> 2) & 3, p & 3), axis=1).ravel()
+        off = start % 4
+        out = _BASES[codes[off : off + (end - start)]]
+        lo, hi = np.searchsorted(self._exc_pos, (start, end))
+        if hi > lo:
+            out[self._exc_pos[lo:hi] - start] = self._exc_val[lo:hi]
+        return out
+
+    def span_buffer(self, start: int, end: int) -> bytearray:
+        """Positions [start, end) as ASCII bytes; positions outside the sequence are ``N``."""
+        start, end = int(start), int(end)
+        buf = bytearray(b"N") * max(0, end - start)
+        s = max(0, start)
+        e = min(self.length, end)
+        if e > s:
+            np.frombuffer(buf, dtype=np.uint8)[s - start : e - start] = self._unpack(s, e)
+        return buf
+
+    def span(self, start: int, end: int) -> str:
+        """:meth:`span_buffer` decoded to a str."""
+        return self.span_buffer(start, end).decode("ascii")
+
+    def __str__(self) -> str:
+        return self.span(0, self.length)
+
+    def __len__(self) -> int:
+        return self.length
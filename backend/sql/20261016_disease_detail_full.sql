@@ -0,0 +1,106 @@
+-- ------------------------------------------------------------
+-- disease_detail_full(): STEP2 payload rows in one RPC
+--  - disease + gene + representative SNV + earliest target window
+--  - focus region (range lookup on the GiST index from
+--    20261016_region_range_gist.sql) and the centered context block,
+--    using the same shift rule as gene_context.pick_regions_with_shift
+--  - audit timestamps are stripped from the returned rows
+--  - used by disease_repo.get_disease_detail_full; the backend falls back
+--    to the PostgREST embed + region queries if it is missing
+-- ------------------------------------------------------------
+create or replace function public.disease_detail_full(
+  p_disease_id text,
+  p_radius integer default 2,
+  p_include_sequence boolean default true
+)
+returns jsonb
+language plpgsql
+stable
+as $$
+declare
+  v_disease public.disease;
+  v_gene jsonb;
+  v_snv jsonb;
+  v_pos integer;
+  v_window jsonb;
+  v_focus_start integer;
+  v_focus integer;
+  v_n integer;
+  v_k integer := 2 * greatest(p_radius, 0) + 1;
+  v_start integer;
+  v_regions jsonb;
+begin
+  select * into v_disease from public.disease d where d.disease_id = p_disease_id;
+  if not found then
+    return null;
+  end if;
+
+  select to_jsonb(g) - 'created_at' - 'updated_at' into v_gene from public.gene g where g.gene_id = v_disease.gene_id;
+
+  select to_jsonb(s) - 'created_at' - 'updated_at', s.pos_gene0 into v_snv, v_pos
+  from public.splice_altering_snv s
+  where s.disease_id = p_disease_id and s.is_representative
+  limit 1;
+
+  select to_jsonb(w) - 'created_at' - 'updated_at' into v_window
+  from public.editing_target_window w
+  where w.disease_id = p_disease_id
+  order by w.created_at
+  limit 1;
+
+  if v_pos is not null then
+    select r.gene_start_idx into v_focus_start
+    from public.region r
+    where r.gene_id = v_disease.gene_id
+      and int4range(r.gene_start_idx, r.gene_end_idx, '[]') && int4range(v_pos, v_pos, '[]')
+    order by r.gene_start_idx
+    limit 1;
+  end if;
+
+  if v_focus_start is not null then
+    select count(*) filter (where r.gene_start_idx < v_focus_start), count(*)
+    into v_focus, v_n
+    from public.region r
+    where r.gene_id = v_disease.gene_id;
+
+    if v_n <= v_k then
+      v_start := 0;
+    else
+      v_start := greatest(0, v_focus - greatest(p_radius, 0));
+      if v_start + v_k > v_n then
+        v_start := greatest(0, v_n - v_k);
+      end if;
+    end if;
+
+    select coalesce(jsonb_agg(to_jsonb(b) order by b.gene_start_idx), '[]'::jsonb) into v_regions
+    from (
+      select
+        r.region_id,
+        r.gene_id,
+        r.region_type,
+        r.region_number,
+        r.gene_start_idx,
+        r.gene_end_idx,
+        r.length,
+        r.cds_start_offset,
+        r.cds_end_offset,
+        case when p_include_sequence then r.sequence else null end as sequence
+      from public.region r
+      where r.gene_id = v_disease.gene_id
+      order by r.gene_start_idx
+      offset v_start
+      limit v_k
+    ) b;
+  end if;
+
+  return jsonb_build_object(
+    'disease', to_jsonb(v_disease) - 'created_at' - 'updated_at',
+    'gene', v_gene,
+    'snv', v_snv,
+    'window', v_window,
+    'focus_index', v_focus,
+    'start_index', v_start,
+    'regions', coalesce(v_regions, '[]'::jsonb)
+  );
+end;
+$$;
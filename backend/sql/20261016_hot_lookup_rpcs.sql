@@ -0,0 +1,61 @@
+-- ------------------------------------------------------------
+-- hot lookups as PL/pgSQL functions
+--  - PL/pgSQL keeps the prepared plan of each statement for the life of the
+--    session, so repeated calls through PostgREST's pooled connections skip
+--    re-planning
+--  - regions_by_gene():    region_repo.list_regions_by_gene
+--  - representative_snv(): snv_repo.get_representative_snv
+--    (the backend falls back to plain PostgREST selects if they are missing)
+-- ------------------------------------------------------------
+create or replace function public.regions_by_gene(
+  p_gene_id text,
+  p_include_sequence boolean default false
+)
+returns table (
+  region_id text,
+  gene_id text,
+  region_type text,
+  region_number integer,
+  gene_start_idx integer,
+  gene_end_idx integer,
+  length integer,
+  cds_start_offset integer,
+  cds_end_offset integer,
+  sequence text
+)
+language plpgsql
+stable
+as $$
+begin
+  return query
+  select
+    r.region_id,
+    r.gene_id,
+    r.region_type,
+    r.region_number,
+    r.gene_start_idx,
+    r.gene_end_idx,
+    r.length,
+    r.cds_start_offset,
+    r.cds_end_offset,
+    case when p_include_sequence then r.sequence else null end
+  from public.region r
+  where r.gene_id = p_gene_id
+  order by r.gene_start_idx;
+end;
+$$;
+
+create or replace function public.representative_snv(p_disease_id text)
+returns setof public.splice_altering_snv
+language plpgsql
+stable
+as $$
+begin
+  return query
+  select s.*
+  from public.splice_altering_snv s
+  where s.disease_id = p_disease_id
+    and s.is_representative
+  limit 1;
+end;
+$$;
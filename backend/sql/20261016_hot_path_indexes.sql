@@ -0,0 +1,26 @@
+-- ------------------------------------------------------------
+-- indexes for the backend's filter + order patterns
+--  - user_state(parent_state_id): self-FK (on delete set null) and
+--    child-state lookups no longer scan user_state
+--  - editing_target_window(disease_id, created_at):
+--    window_repo.get_target_window (eq disease_id, order created_at)
+--  - structure_job(state_id, updated_at desc, created_at desc):
+--    structure_job_repo.list_jobs_for_state ordering
+--  - structure_job(status, created_at): queue polling (eq status, order created_at)
+--  - structure_job((result_payload->>'user_protein_sha256')): reuse lookup
+-- ------------------------------------------------------------
+create index if not exists idx_state_parent
+on public.user_state(parent_state_id)
+where parent_state_id is not null;
+
+create index if not exists idx_window_disease_created
+on public.editing_target_window(disease_id, created_at);
+
+create index if not exists idx_structure_job_state_recent
+on public.structure_job(state_id, updated_at desc, created_at desc);
+
+create index if not exists idx_structure_job_status_created
+on public.structure_job(status, created_at);
+
+create index if not exists idx_structure_job_user_protein_sha256
+on public.structure_job((result_payload->>'user_protein_sha256'));
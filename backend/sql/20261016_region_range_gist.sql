@@ -0,0 +1,50 @@
+-- ------------------------------------------------------------
+-- region range lookups (window / overlap queries)
+--  - GiST index over int4range(gene_start_idx, gene_end_idx, '[]') so
+--    "regions overlapping [start, end]" is an index range scan (&&)
+--  - regions_overlapping(): RPC used by region_repo.list_regions_overlapping
+--    (the backend falls back to a plain PostgREST filter if it is missing)
+-- ------------------------------------------------------------
+create extension if not exists btree_gist;
+
+create index if not exists idx_region_gene_range_gist
+on public.region
+using gist (gene_id, int4range(gene_start_idx, gene_end_idx, '[]'));
+
+create or replace function public.regions_overlapping(
+  p_gene_id text,
+  p_start integer,
+  p_end integer,
+  p_include_sequence boolean default false
+)
+returns table (
+  region_id text,
+  gene_id text,
+  region_type text,
+  region_number integer,
+  gene_start_idx integer,
+  gene_end_idx integer,
+  length integer,
+  cds_start_offset integer,
+  cds_end_offset integer,
+  sequence text
+)
+language sql
+stable
+as $$
+  select
+    r.region_id,
+    r.gene_id,
+    r.region_type,
+    r.region_number,
+    r.gene_start_idx,
+    r.gene_end_idx,
+    r.length,
+    r.cds_start_offset,
+    r.cds_end_offset,
+    case when p_include_sequence then r.sequence else null end
+  from public.region r
+  where r.gene_id = p_gene_id
+    and int4range(r.gene_start_idx, r.gene_end_idx, '[]') && int4range(p_start, p_end, '[]')
+  order by r.gene_start_idx;
+$$;
@@ -0,0 +1,40 @@
+-- ------------------------------------------------------------
+-- region_window_sequence(): only the bases of [p_start, p_end]
+--  - returns each overlapping region clipped to the window: gene_start_idx /
+--    gene_end_idx are the clipped bounds and sequence is the matching
+--    substring, so a 4kb window over a megabase intron ships 4kb, not 1Mb
+--  - used by region_repo.get_window_region_slices (window endpoint); the
+--    backend falls back to whole-region sequences if it is missing
+-- ------------------------------------------------------------
+create or replace function public.region_window_sequence(
+  p_gene_id text,
+  p_start integer,
+  p_end integer
+)
+returns table (
+  region_id text,
+  region_type text,
+  region_number integer,
+  gene_start_idx integer,
+  gene_end_idx integer,
+  sequence text
+)
+language sql
+stable
+as $$
+  select
+    r.region_id,
+    r.region_type,
+    r.region_number,
+    greatest(r.gene_start_idx, p_start),
+    least(r.gene_end_idx, p_end),
+    substring(
+      r.sequence
+      from greatest(r.gene_start_idx, p_start) - r.gene_start_idx + 1
+      for least(r.gene_end_idx, p_end) - greatest(r.gene_start_idx, p_start) + 1
+    )
+  from public.region r
+  where r.gene_id = p_gene_id
+    and int4range(r.gene_start_idx, r.gene_end_idx, '[]') && int4range(p_start, p_end, '[]')
+  order by r.gene_start_idx;
+$$;
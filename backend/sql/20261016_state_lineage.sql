@@ -0,0 +1,42 @@
+-- ------------------------------------------------------------
+-- state_lineage(): a user_state row plus all of its ancestors in one call
+--  - state_repo.prefetch_state_lineage uses it to warm the state cache
+--    before the parent-chain walk (create_state / STEP3 / STEP4), which
+--    otherwise costs one PostgREST round-trip per ancestor
+--  - rows come back leaf -> root; depth is capped so a corrupted cyclic
+--    chain still terminates (the backend walk reports the cycle)
+--    (the backend falls back to per-row selects if it is missing)
+-- ------------------------------------------------------------
+create or replace function public.state_lineage(p_state_id uuid)
+returns table (
+  state_id uuid,
+  disease_id text,
+  gene_id text,
+  parent_state_id uuid,
+  applied_edit jsonb,
+  created_at timestamptz,
+  updated_at timestamptz
+)
+language plpgsql
+stable
+as $$
+begin
+  return query
+  with recursive chain as (
+    select s.state_id, s.disease_id, s.gene_id, s.parent_state_id,
+           s.applied_edit, s.created_at, s.updated_at, 0 as depth
+    from public.user_state s
+    where s.state_id = p_state_id
+    union all
+    select p.state_id, p.disease_id, p.gene_id, p.parent_state_id,
+           p.applied_edit, p.created_at, p.updated_at, c.depth + 1
+    from chain c
+    join public.user_state p on p.state_id = c.parent_state_id
+    where c.depth < 256
+  )
+  select c.state_id, c.disease_id, c.gene_id, c.parent_state_id,
+         c.applied_edit, c.created_at, c.updated_at
+  from chain c
+  order by c.depth;
+end;
+$$;
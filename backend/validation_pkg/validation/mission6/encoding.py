@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import numpy as np
 
+# Byte value -> one-hot row (A,C,G,T; either case). Every other byte, N
+# included, maps to the all-zero row.
+_ONEHOT_LUT = np.zeros((256, 4), dtype=np.float32)
+for _j, _b in enumerate(b"ACGT"):
+    _ONEHOT_LUT[_b, _j] = 1.0
+    _ONEHOT_LUT[_b + 32, _j] = 1.0  # lowercase
+del _j, _b
+
+
 def one_hot_encode(seq: str) -> np.ndarray:
     """One-hot encode DNA to shape (4, L) float32 with channels A,C,G,T.
 
     Unknown / N -> all zeros.
     """
-    m = {"A": 0, "C": 1, "G": 2, "T": 3}
-    L = len(seq)
-    X = np.zeros((L, 4), dtype=np.float32)
-    for i, ch in enumerate(seq.upper()):
-        j = m.get(ch)
-        if j is not None:
-            X[i, j] = 1.0
-    return X.T  # (4, L)
+    idx = np.frombuffer(seq.encode("ascii", "replace"), dtype=np.uint8)
+    return _ONEHOT_LUT[idx].T  # (4, L)
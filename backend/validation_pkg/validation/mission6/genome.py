@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 from pyfaidx import Fasta
 
-from .utils import rc, with_chr_prefix, without_chr_prefix
+from .utils import rc_bytes, with_chr_prefix, without_chr_prefix
 
 
 @dataclass
@@ -22,8 +23,16 @@ class ReferenceGenome:
         self._keys = set(self.fa.keys())
         # detect whether fasta keys use 'chr' prefix
         self._has_chr = any(k.startswith("chr") for k in list(self._keys)[:10])
+        # raw chrom -> FASTA key (resolved once per distinct spelling)
+        self._key_cache: Dict[str, str] = {}
 
     def _normalize_key(self, chrom: str) -> str:
+        key = self._key_cache.get(chrom)
+        if key is None:
+            key = self._key_cache[chrom] = self._resolve_key(chrom)
+        return key
+
+    def _resolve_key(self, chrom: str) -> str:
         c = str(chrom).strip()
         if self._has_chr:
             c = with_chr_prefix(c)
@@ -47,6 +56,10 @@ class ReferenceGenome:
           - For DB canonical sequence validation, you usually want mission6_neg_shift=False
             to fetch the standard transcript span exactly.
         """
+        return self.fetch_bytes(chrom, start0, end0, strand=strand, mission6_neg_shift=mission6_neg_shift).tobytes().decode("ascii")
+
+    def fetch_bytes(self, chrom: str, start0: int, end0: int, strand: str = "+", mission6_neg_shift: bool = True) -> np.ndarray:
+        """:meth:`fetch_seq` as a uint8 ASCII array (no intermediate str copies)."""
         if start0 < 0:
             raise ValueError("start0 must be >= 0 (clip before calling fetch_seq)")
         if end0 < start0:
@@ -58,8 +71,14 @@ class ReferenceGenome:
             start0 += 1
             end0 += 1
 
-        seq = str(self.fa[key][start0:end0]).upper()
+        seq = self.fa[key][start0:end0]
+        if not self.as_raw:
+            seq = str(seq)
+        if not self.sequence_always_upper:
+            # pyfaidx already upper-cases when sequence_always_upper is set
+            seq = seq.upper()
+        arr = np.frombuffer(seq.encode("ascii"), dtype=np.uint8)
 
         if strand == "-":
-            seq = rc(seq)
-        return seq
+            arr = rc_bytes(arr)
+        return arr
@@ -22,25 +22,53 @@ class InferenceConfig:
         return torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
 
+def model_on_device(model: torch.nn.Module, device: torch.device) -> torch.nn.Module:
+    """Move ``model`` only if it is not already on ``device`` (load_model places it)."""
+    param = next(model.parameters(), None)
+    if param is not None and param.device == device:
+        return model
+    return model.to(device)
+
+
 def predict_probs(model: torch.nn.Module, X: np.ndarray, cfg: InferenceConfig = InferenceConfig()) -> np.ndarray:
     """Run model and return softmax probabilities as numpy array: (N, 3, L)."""
     if X.ndim != 3:
         raise ValueError(f"X must be (N,4,L), got {X.shape}")
     device = cfg.torch_device()
-    model = model.to(device)
+    model = model_on_device(model, device)
 
     N = X.shape[0]
     out_list: List[np.ndarray] = []
 
-    with torch.no_grad():
+    with torch.inference_mode():
         for i in tqdm(range(0, N, cfg.batch_size), desc="inference", leave=False):
-            xb = torch.from_numpy(X[i : i + cfg.batch_size]).to(device)
+            xb = torch.from_numpy(X[i : i + cfg.batch_size]).to(device, non_blocking=True)
             logits = model(xb)
-            probs = F.softmax(logits, dim=1).detach().cpu().numpy()
+            probs = F.softmax(logits, dim=1).cpu().numpy()
             out_list.append(probs)
     return np.concatenate(out_list, axis=0)
 
 
+def predict_probs_pairs(
+    model: torch.nn.Module,
+    X_ref: np.ndarray,
+    X_alt: np.ndarray,
+    cfg: InferenceConfig = InferenceConfig(),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(prob_ref, prob_alt) for paired (N,4,L) inputs.
+
+    Rows are interleaved ref0, alt0, ref1, alt1, ... so each variant's pair
+    shares a forward pass instead of running two separate sweeps.
+    """
+    if X_ref.shape != X_alt.shape:
+        raise ValueError(f"X_ref/X_alt shape mismatch: {X_ref.shape} vs {X_alt.shape}")
+    N = X_ref.shape[0]
+    X = np.stack([X_ref, X_alt], axis=1).reshape(2 * N, *X_ref.shape[1:])
+    probs = predict_probs(model, X, cfg)
+    probs = probs.reshape(N, 2, *probs.shape[1:])  # (N,2,3,L)
+    return probs[:, 0], probs[:, 1]
+
+
 def encode_sequences(seqs: List[str]) -> np.ndarray:
     """Encode list of sequences to (N,4,L)."""
     X_list = [one_hot_encode(s) for s in seqs]
@@ -9,6 +9,8 @@ from .constants import IN_LENGTH
 from .genome import ReferenceGenome
 from .utils import WindowMapping, rc
 
+_N = ord("N")
+
 
 def extract_window_idx_mission6(
     genome: ReferenceGenome,
@@ -35,18 +37,15 @@ def extract_window_idx_mission6(
     fetch_start = max(0, start)
     fetch_end = max(fetch_start, end)
 
-    seq = genome.fetch_seq(chrom, fetch_start, fetch_end, strand=strand)
+    fetched = genome.fetch_bytes(chrom, fetch_start, fetch_end, strand=strand)
 
-    # left pad if start < 0
-    left_pad = fetch_start - start
-    if left_pad > 0:
-        seq = ("N" * left_pad) + seq
+    # Build the window in one N-filled byte buffer instead of str concats.
+    buf = np.full(input_length, _N, dtype=np.uint8)
 
-    # length adjust
-    if len(seq) < input_length:
-        seq = seq + ("N" * (input_length - len(seq)))
-    else:
-        seq = seq[:input_length]
+    # left pad if start < 0, then copy (truncating to input_length)
+    left_pad = min(fetch_start - start, input_length)
+    fetched = fetched[: input_length - left_pad]
+    buf[left_pad : left_pad + len(fetched)] = fetched
 
     # gene outside masking
     gene_start_0b = int(tx_start_1b) - 1
@@ -66,11 +65,11 @@ def extract_window_idx_mission6(
         right_n = overhang_left_genomic
 
     if left_n > 0:
-        seq = ("N" * left_n) + seq[left_n:]
+        buf[:left_n] = _N
     if right_n > 0:
-        seq = seq[:-right_n] + ("N" * right_n)
+        buf[input_length - right_n :] = _N
 
-    return seq
+    return buf.tobytes().decode("ascii")
 
 
 def apply_alt_at_center(seq_ref: str, alt_base_pos_strand: str, strand: str) -> str:
@@ -84,10 +83,9 @@ def apply_alt_at_center(seq_ref: str, alt_base_pos_strand: str, strand: str) ->
         raise ValueError(f"alt must be single nucleotide, got: {alt_base_pos_strand!r}")
     if strand == "-":
         alt = rc(alt)
-    seq_list = list(seq_ref)
-    center_idx = len(seq_ref) // 2
-    seq_list[center_idx] = alt
-    return "".join(seq_list)
+    buf = bytearray(seq_ref, "ascii")
+    buf[len(buf) // 2] = ord(alt)
+    return buf.decode("ascii")
 
 
 def build_ref_alt_sequences_from_row(
@@ -3,11 +3,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, Optional, Tuple
 
+import numpy as np
+
 DNA_COMP = str.maketrans("ACGTNacgtn", "TGCANtgcan")
 
+# Byte -> complement byte (same pairs as DNA_COMP; other bytes map to themselves).
+_COMP_LUT = np.arange(256, dtype=np.uint8)
+_COMP_LUT[np.frombuffer(b"ACGTNacgtn", dtype=np.uint8)] = np.frombuffer(b"TGCANtgcan", dtype=np.uint8)
+
+def rc_bytes(arr: np.ndarray) -> np.ndarray:
+    """Reverse-complement a uint8 ASCII array: one gather, reversal is a view."""
+    return _COMP_LUT[arr][::-1]
+
 def rc(seq: str) -> str:
     """Reverse-complement (DNA). Keeps N as N."""
-    return seq.translate(DNA_COMP)[::-1]
+    return rc_bytes(np.frombuffer(seq.encode("ascii"), dtype=np.uint8)).tobytes().decode("ascii")
 
 def complement_base(base: str) -> str:
     b = (base or "").strip().upper()
@@ -11,7 +11,7 @@ import pandas as pd
 from .annotation import RefAnnotation
 from .backend_client import BackendClient
 from .genome import ReferenceGenome
-from .inference import InferenceConfig, encode_sequences, predict_probs
+from .inference import InferenceConfig, encode_sequences, predict_probs_pairs
 from .model import load_model
 from .scoring import calculate_variant_score
 from .sequence import build_ref_alt_sequences_from_row
@@ -116,8 +116,7 @@ def main() -> None:
     X_alt = encode_sequences(alt_seqs)
 
     cfg = InferenceConfig(batch_size=args.batch_size)
-    prob_ref = predict_probs(model, X_ref, cfg)
-    prob_alt = predict_probs(model, X_alt, cfg)
+    prob_ref, prob_alt = predict_probs_pairs(model, X_ref, X_alt, cfg)
     scores = calculate_variant_score(prob_ref, prob_alt)
 
     report: Dict[str, Any] = {
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 import torch
@@ -9,6 +9,7 @@ import torch.nn.functional as F
 from tqdm import tqdm
 
 from ..mission6.encoding import one_hot_encode
+from ..mission6.inference import model_on_device
 from .constants import core_slice
 
 
@@ -54,19 +55,38 @@ def predict_probs_center_crop(
     sl = core_slice(in_length, out_length)
 
     device = cfg.torch_device()
-    model = model.to(device)
+    model = model_on_device(model, device)
 
     N = X.shape[0]
     out_list: List[np.ndarray] = []
 
-    with torch.no_grad():
+    with torch.inference_mode():
         for i in tqdm(range(0, N, cfg.batch_size), desc="inference", leave=False):
-            xb = torch.from_numpy(X[i : i + cfg.batch_size]).to(device)
+            xb = torch.from_numpy(X[i : i + cfg.batch_size]).to(device, non_blocking=True)
             logits = model(xb)  # (B,3,in_length)
             if logits.ndim != 3 or logits.shape[1] != 3:
                 raise ValueError(f"Unexpected logits shape: {tuple(logits.shape)}")
             logits = logits[:, :, sl]  # (B,3,out_length)
-            probs = F.softmax(logits, dim=1).detach().cpu().numpy()
+            probs = F.softmax(logits, dim=1).cpu().numpy()
             out_list.append(probs)
 
     return np.concatenate(out_list, axis=0)
+
+
+def predict_probs_center_crop_pairs(
+    model: torch.nn.Module,
+    X_ref: np.ndarray,
+    X_alt: np.ndarray,
+    *,
+    in_length: int,
+    out_length: int,
+    cfg: InferenceConfig = InferenceConfig(),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(prob_ref, prob_alt) with each ref/alt pair in the same forward pass."""
+    if X_ref.shape != X_alt.shape:
+        raise ValueError(f"X_ref/X_alt shape mismatch: {X_ref.shape} vs {X_alt.shape}")
+    N = X_ref.shape[0]
+    X = np.stack([X_ref, X_alt], axis=1).reshape(2 * N, *X_ref.shape[1:])
+    probs = predict_probs_center_crop(model, X, in_length=in_length, out_length=out_length, cfg=cfg)
+    probs = probs.reshape(N, 2, *probs.shape[1:])  # (N,2,3,out_length)
+    return probs[:, 0], probs[:, 1]
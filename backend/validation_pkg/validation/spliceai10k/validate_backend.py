@@ -16,7 +16,7 @@ from ..mission6.splice_sites import summarize_sites, calls_at_annotated_sites
 from ..mission6.utils import with_chr_prefix
 
 from .constants import IN_LENGTH_DEFAULT, OUT_LENGTH_DEFAULT, core_slice
-from .inference import InferenceConfig, encode_sequences, predict_probs_center_crop
+from .inference import InferenceConfig, encode_sequences, predict_probs_center_crop_pairs
 from .scoring import calculate_variant_score
 
 
@@ -208,8 +208,7 @@ def main() -> None:
     X_ref = encode_sequences(ref_seqs)
     X_alt = encode_sequences(alt_seqs)
 
-    prob_ref = predict_probs_center_crop(model, X_ref, in_length=in_len, out_length=out_len, cfg=cfg)
-    prob_alt = predict_probs_center_crop(model, X_alt, in_length=in_len, out_length=out_len, cfg=cfg)
+    prob_ref, prob_alt = predict_probs_center_crop_pairs(model, X_ref, X_alt, in_length=in_len, out_length=out_len, cfg=cfg)
     scores = calculate_variant_score(prob_ref, prob_alt)
 
     report_variants: List[Dict[str, Any]] = []
@@ -15,7 +15,7 @@ from ..mission6.sequence import build_ref_alt_sequences_from_row
 from ..mission6.utils import with_chr_prefix
 
 from .constants import IN_LENGTH_DEFAULT, OUT_LENGTH_DEFAULT, core_slice
-from .inference import InferenceConfig, encode_sequences, predict_probs_center_crop
+from .inference import InferenceConfig, encode_sequences, predict_probs_center_crop_pairs
 from .scoring import calculate_variant_score
 
 
@@ -148,8 +148,9 @@ def main() -> None:
         alt_seqs = [r["alt_seq_in"] for r in rows]
         X_ref = encode_sequences(ref_seqs)
         X_alt = encode_sequences(alt_seqs)
-        prob_ref = predict_probs_center_crop(model, X_ref, in_length=int(args.window_size), out_length=int(args.out_len), cfg=cfg)
-        prob_alt = predict_probs_center_crop(model, X_alt, in_length=int(args.window_size), out_length=int(args.out_len), cfg=cfg)
+        prob_ref, prob_alt = predict_probs_center_crop_pairs(
+            model, X_ref, X_alt, in_length=int(args.window_size), out_length=int(args.out_len), cfg=cfg
+        )
         scores = calculate_variant_score(prob_ref, prob_alt)
         return prob_ref, prob_alt, scores
 